@@ -22,6 +22,7 @@ from .exceptions import CoordinateSystemMismatchError, MissingCoordinateSystemEr
 from .fastqc_op import FastQCOperations as fastqc_operations
 from .fastqc_op import FastQCResult
 from .io import IOOperations as data_input
+from .io import clear_vcf_header_cache
 from .logging import set_loglevel
 from .pileup_op import PileupOperations as pileup_operations
 from .range_op import FilterOp
@@ -157,6 +158,7 @@ __all__ = [
     "print_metadata_json",
     "print_metadata_summary",
     # I/O functions
+    "clear_vcf_header_cache",
     "describe_vcf",
     "describe_vcf_zarr",
     "describe_bam",
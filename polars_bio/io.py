@@ -1,13 +1,20 @@
+import functools
+import itertools
+import json
 import logging
+import operator
+import os
+import re
+import threading
 import weakref as _weakref
+from collections import OrderedDict
 from typing import Dict, Iterator, Optional, Union
 
 import polars as pl
+import pyarrow as pa
 
 logger = logging.getLogger(__name__)
-from datafusion import DataFrame
 from polars.io.plugins import register_io_source
-from tqdm.auto import tqdm
 
 from polars_bio.polars_bio import (
     BamReadOptions,
@@ -38,13 +45,19 @@ from polars_bio.polars_bio import (
     py_describe_vcf_zarr,
     py_from_polars,
     py_get_table_schema,
-    py_read_sql,
     py_read_table,
     py_register_table,
     py_write_table,
 )
 
-from ._metadata import get_vcf_metadata, set_coordinate_system, set_vcf_metadata
+from ._metadata import (
+    get_coordinate_system,
+    get_metadata,
+    get_vcf_metadata,
+    set_coordinate_system,
+    set_source_metadata,
+    set_vcf_metadata,
+)
 from .context import _resolve_zero_based, ctx
 from .predicate_translator import (
     BAM_INT32_COLUMNS,
@@ -65,6 +78,11 @@ from .predicate_translator import (
     VCF_STRING_COLUMNS,
     VCF_UINT32_COLUMNS,
 )
+from .pushdown import (
+    apply_predicate_pushdown,
+    apply_projection_pushdown,
+    extract_source_columns,
+)
 
 # Mapping from format name to (string_cols, uint32_cols, float32_cols) for predicate validation.
 # Uses string keys because PyO3 InputFormat is not hashable.
@@ -81,6 +99,23 @@ _FORMAT_COLUMN_TYPES = {
     "BigBed": (BIGBED_STRING_COLUMNS, BIGBED_UINT32_COLUMNS, BIGBED_FLOAT32_COLUMNS),
 }
 
+# Fixed GFF/GTF columns; anything else a projection names is an attribute field.
+_GFF_STATIC_COLUMNS = frozenset(
+    {
+        "chrom",
+        "start",
+        "end",
+        "type",
+        "source",
+        "score",
+        "strand",
+        "phase",
+        "attributes",
+    }
+)
+# Static columns available without re-registering (``attributes`` is nested).
+_GFF_FLAT_STATIC_COLUMNS = _GFF_STATIC_COLUMNS - {"attributes"}
+
 _VALID_SAM_SCALAR_TYPE_CODES = {"A", "c", "C", "s", "S", "i", "I", "f", "Z", "H"}
 _VALID_SAM_ARRAY_SUBTYPE_CODES = {"c", "C", "s", "S", "i", "I", "f"}
 _VALID_SAM_TYPE_CODES = _VALID_SAM_SCALAR_TYPE_CODES | {"B"}
@@ -180,48 +215,23 @@ def _validate_tag_type_overrides(tag_type_overrides: Dict[str, str]) -> None:
         _validate_sam_type_spec(type_spec, "tag_type_override", f"{tag}={type_spec}")
 
 
-SCHEMAS = {
-    "bed3": ["chrom", "start", "end"],
-    "bed4": ["chrom", "start", "end", "name"],
-    "bed5": ["chrom", "start", "end", "name", "score"],
-    "bed6": ["chrom", "start", "end", "name", "score", "strand"],
-    "bed7": ["chrom", "start", "end", "name", "score", "strand", "thickStart"],
-    "bed8": [
-        "chrom",
-        "start",
-        "end",
-        "name",
-        "score",
-        "strand",
-        "thickStart",
-        "thickEnd",
-    ],
-    "bed9": [
-        "chrom",
-        "start",
-        "end",
-        "name",
-        "score",
-        "strand",
-        "thickStart",
-        "thickEnd",
-        "itemRgb",
-    ],
-    "bed12": [
-        "chrom",
-        "start",
-        "end",
-        "name",
-        "score",
-        "strand",
-        "thickStart",
-        "thickEnd",
-        "itemRgb",
-        "blockCount",
-        "blockSizes",
-        "blockStarts",
-    ],
-}
+_BED_COLUMNS = (
+    "chrom",
+    "start",
+    "end",
+    "name",
+    "score",
+    "strand",
+    "thickStart",
+    "thickEnd",
+    "itemRgb",
+    "blockCount",
+    "blockSizes",
+    "blockStarts",
+)
+
+# BED variants share the leading columns of bed12.
+SCHEMAS = {f"bed{n}": _BED_COLUMNS[:n] for n in (3, 4, 5, 6, 7, 8, 9, 12)}
 
 
 def _quote_sql_identifier(identifier: str) -> str:
@@ -230,6 +240,12 @@ def _quote_sql_identifier(identifier: str) -> str:
     return f'"{escaped}"'
 
 
+def _quote_sql_string(value: str) -> str:
+    """Quote a string literal for DataFusion SQL text."""
+    escaped = str(value).replace("'", "''")
+    return f"'{escaped}'"
+
+
 def _normalize_bigbed_schema_mode(schema: str) -> str:
     normalized = str(schema).lower()
     if normalized not in {"auto", "rest"}:
@@ -240,7 +256,7 @@ def _normalize_bigbed_schema_mode(schema: str) -> str:
 class IOOperations:
     @staticmethod
     def read_fasta(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -249,13 +265,14 @@ class IOOperations:
         timeout: int = 300,
         compression_type: str = "auto",
         projection_pushdown: bool = True,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
 
         Read a FASTA file into a DataFrame.
 
         Parameters:
-            path: The path to the FASTA file.
+            path: The path to the FASTA file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -264,6 +281,7 @@ class IOOperations:
             timeout: The timeout in seconds for reading the file from object storage.
             compression_type: The compression type of the FASTA file. If not specified, it will be detected automatically based on the file extension. BGZF and GZIP compressions are supported ('bgz', 'gz').
             projection_pushdown: Enable column projection pushdown optimization. When True, only requested columns are processed at the DataFusion execution level, improving performance and reducing memory usage.
+            n_rows: The maximum number of sequences to read. If not specified, all sequences in the file are read.
 
         !!! Example
             ```shell
@@ -285,7 +303,7 @@ class IOOperations:
             └─────────────────────────┴─────────────────────────────────┴─────────────────────────────────┘
             ```
         """
-        return IOOperations.scan_fasta(
+        lf = IOOperations.scan_fasta(
             path,
             chunk_size,
             concurrent_fetches,
@@ -295,11 +313,14 @@ class IOOperations:
             timeout,
             compression_type,
             projection_pushdown,
-        ).collect()
+        )
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
+        return lf.collect()
 
     @staticmethod
     def scan_fasta(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -314,7 +335,7 @@ class IOOperations:
         Lazily read a FASTA file into a LazyFrame.
 
         Parameters:
-            path: The path to the FASTA file.
+            path: The path to the FASTA file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -361,7 +382,7 @@ class IOOperations:
 
     @staticmethod
     def read_vcf(
-        path: str,
+        path: Union[str, os.PathLike],
         info_fields: Union[list[str], None] = None,
         format_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
@@ -376,6 +397,7 @@ class IOOperations:
         use_zero_based: Optional[bool] = None,
         samples: Union[list[str], None] = None,
         genotype_encoding_raw: bool = True,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a VCF file into a DataFrame.
@@ -387,7 +409,7 @@ class IOOperations:
             and [Automatic parallel partitioning](/polars-bio/features/#automatic-parallel-partitioning) for details.
 
         Parameters:
-            path: The path to the VCF file.
+            path: The path to the VCF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             info_fields: List of INFO field names to include. If *None*, all INFO fields from the VCF header are included by default. Use this to limit fields for better performance.
             format_fields: List of FORMAT field names to include (per-sample genotype data). If *None*, all FORMAT fields are included by default. For **single-sample** VCFs, FORMAT fields are top-level columns (e.g., `GT`, `DP`). For **multi-sample** VCFs, FORMAT data is exposed as a nested `genotypes` column (`struct<GT: list, DP: list, ...>`) with sample names in `meta["header"]["sample_names"]`.
             samples: Optional list of sample names to include from the VCF header. Matching is exact and case-sensitive. Missing sample names are skipped with a warning. The output follows the requested sample order.
@@ -402,6 +424,7 @@ class IOOperations:
             predicate_pushdown: Enable predicate pushdown using index files (TBI/CSI) for efficient region-based filtering. Index files are auto-discovered (e.g., `file.vcf.gz.tbi`). Only simple predicates are pushed down (equality, comparisons, IN); complex predicates like `.str.contains()` or OR logic are filtered client-side. Correctness is always guaranteed.
             use_zero_based: If True, output 0-based half-open coordinates. If False, output 1-based closed coordinates. If None (default), uses the global configuration `datafusion.bio.coordinate_system_zero_based`.
             genotype_encoding_raw: If True, output GT as raw typed allele calls. If False, output VCF-style GT strings.
+            n_rows: Maximum number of variant records to read. If None (default), all records are read.
 
         !!! note
             By default, coordinates are output in **1-based closed** format. Use `use_zero_based=True` or set `pb.set_option(pb.POLARS_BIO_COORDINATE_SYSTEM_ZERO_BASED, True)` for 0-based half-open coordinates.
@@ -452,6 +475,8 @@ class IOOperations:
         )
         # Get metadata before collecting (polars-config-meta doesn't preserve through collect)
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         # Set metadata on the collected DataFrame
         if zero_based is not None:
@@ -460,7 +485,7 @@ class IOOperations:
 
     @staticmethod
     def scan_vcf(
-        path: str,
+        path: Union[str, os.PathLike],
         info_fields: Union[list[str], None] = None,
         format_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
@@ -485,7 +510,7 @@ class IOOperations:
             and [Automatic parallel partitioning](/polars-bio/features/#automatic-parallel-partitioning) for details.
 
         Parameters:
-            path: The path to the VCF file.
+            path: The path to the VCF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             info_fields: List of INFO field names to include. If *None*, all INFO fields from the VCF header are included by default. Use this to limit fields for better performance.
             format_fields: List of FORMAT field names to include (per-sample genotype data). If *None*, all FORMAT fields are included by default. For **single-sample** VCFs, FORMAT fields are top-level columns (e.g., `GT`, `DP`). For **multi-sample** VCFs, FORMAT data is exposed as a nested `genotypes` column (`struct<GT: list, DP: list, ...>`) with sample names in `meta["header"]["sample_names"]`.
             samples: Optional list of sample names to include from the VCF header. Matching is exact and case-sensitive. Missing sample names are skipped with a warning. The output follows the requested sample order.
@@ -556,7 +581,7 @@ class IOOperations:
 
     @staticmethod
     def read_vcf_zarr(
-        path: str,
+        path: Union[str, os.PathLike],
         info_fields: Union[list[str], None] = None,
         format_fields: Union[list[str], None] = None,
         projection_pushdown: bool = True,
@@ -564,12 +589,13 @@ class IOOperations:
         use_zero_based: Optional[bool] = None,
         samples: Union[list[str], None] = None,
         genotype_encoding_raw: bool = True,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a local VCF Zarr store into a DataFrame.
 
         Parameters:
-            path: The path to the VCF Zarr store directory.
+            path: The path to the VCF Zarr store directory. A `str` or an `os.PathLike` such as `pathlib.Path`.
             info_fields: Optional list of INFO field names to include. If None, local INFO arrays are discovered automatically. Use [] to disable INFO fields.
             format_fields: Optional list of FORMAT field names to include. If None, local FORMAT arrays are discovered automatically. Use [] to disable FORMAT fields.
             projection_pushdown: Enable column projection pushdown at the DataFusion level.
@@ -577,6 +603,7 @@ class IOOperations:
             use_zero_based: If True, output 0-based half-open coordinates. If False, output 1-based closed coordinates. If None, uses the global configuration.
             samples: Optional list of sample names to include.
             genotype_encoding_raw: If True, output GT as raw typed allele calls. If False, output VCF-style GT strings.
+            n_rows: Optional maximum number of variant rows to read.
         """
         lf = IOOperations.scan_vcf_zarr(
             path=path,
@@ -589,6 +616,8 @@ class IOOperations:
             genotype_encoding_raw=genotype_encoding_raw,
         )
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         if zero_based is not None:
             set_coordinate_system(df, zero_based)
@@ -596,7 +625,7 @@ class IOOperations:
 
     @staticmethod
     def scan_vcf_zarr(
-        path: str,
+        path: Union[str, os.PathLike],
         info_fields: Union[list[str], None] = None,
         format_fields: Union[list[str], None] = None,
         projection_pushdown: bool = True,
@@ -609,7 +638,7 @@ class IOOperations:
         Lazily read a local VCF Zarr store into a LazyFrame.
 
         Parameters:
-            path: The path to the VCF Zarr store directory.
+            path: The path to the VCF Zarr store directory. A `str` or an `os.PathLike` such as `pathlib.Path`.
             info_fields: Optional list of INFO field names to include. If None, local INFO arrays are discovered automatically. Use [] to disable INFO fields.
             format_fields: Optional list of FORMAT field names to include. If None, local FORMAT arrays are discovered automatically. Use [] to disable FORMAT fields.
             projection_pushdown: Enable column projection pushdown at the DataFusion level.
@@ -638,7 +667,7 @@ class IOOperations:
 
     @staticmethod
     def read_gff(
-        path: str,
+        path: Union[str, os.PathLike],
         attr_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
@@ -650,12 +679,13 @@ class IOOperations:
         projection_pushdown: bool = True,
         predicate_pushdown: bool = True,
         use_zero_based: Optional[bool] = None,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a GFF file into a DataFrame.
 
         Parameters:
-            path: The path to the GFF file.
+            path: The path to the GFF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             attr_fields: List of attribute field names to extract as separate columns. If *None*, attributes will be kept as a nested structure. Use this to extract specific attributes like 'ID', 'gene_name', 'gene_type', etc. as direct columns for easier access.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
@@ -667,6 +697,7 @@ class IOOperations:
             projection_pushdown: Enable column projection pushdown to optimize query performance by only reading the necessary columns at the DataFusion level.
             predicate_pushdown: Enable predicate pushdown using index files (TBI/CSI) for efficient region-based filtering. Index files are auto-discovered (e.g., `file.gff.gz.tbi`). Only simple predicates are pushed down (equality, comparisons, IN); complex predicates like `.str.contains()` or OR logic are filtered client-side. Correctness is always guaranteed.
             use_zero_based: If True, output 0-based half-open coordinates. If False, output 1-based closed coordinates. If None (default), uses the global configuration `datafusion.bio.coordinate_system_zero_based`.
+            n_rows: Maximum number of features to read. If None (default), the whole file is read.
 
         !!! note
             By default, coordinates are output in **1-based closed** format. Use `use_zero_based=True` or set `pb.set_option(pb.POLARS_BIO_COORDINATE_SYSTEM_ZERO_BASED, True)` for 0-based half-open coordinates.
@@ -687,6 +718,8 @@ class IOOperations:
         )
         # Get metadata before collecting (polars-config-meta doesn't preserve through collect)
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         # Set metadata on the collected DataFrame
         if zero_based is not None:
@@ -695,7 +728,7 @@ class IOOperations:
 
     @staticmethod
     def scan_gff(
-        path: str,
+        path: Union[str, os.PathLike],
         attr_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
@@ -712,7 +745,7 @@ class IOOperations:
         Lazily read a GFF file into a LazyFrame.
 
         Parameters:
-            path: The path to the GFF file.
+            path: The path to the GFF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             attr_fields: List of attribute field names to extract as separate columns. If *None*, attributes will be kept as a nested structure. Use this to extract specific attributes like 'ID', 'gene_name', 'gene_type', etc. as direct columns for easier access.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large-scale operations, it is recommended to increase this value to 8 or even more.
@@ -757,7 +790,7 @@ class IOOperations:
 
     @staticmethod
     def read_gtf(
-        path: str,
+        path: Union[str, os.PathLike],
         attr_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
@@ -769,6 +802,7 @@ class IOOperations:
         projection_pushdown: bool = True,
         predicate_pushdown: bool = True,
         use_zero_based: Optional[bool] = None,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a GTF file into a DataFrame.
@@ -777,7 +811,7 @@ class IOOperations:
         different attribute syntax (``key "value"`` vs GFF's ``key=value``).
 
         Parameters:
-            path: The path to the GTF file.
+            path: The path to the GTF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             attr_fields: List of attribute field names to extract as separate columns.
                 If *None*, attributes will be kept as a nested structure.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
@@ -790,6 +824,7 @@ class IOOperations:
             projection_pushdown: Enable column projection pushdown to optimize query performance by only reading the necessary columns at the DataFusion level.
             predicate_pushdown: Enable predicate pushdown using index files (TBI/CSI) for efficient region-based filtering. Index files are auto-discovered (e.g., `file.gtf.gz.tbi`). Only simple predicates are pushed down (equality, comparisons, IN); complex predicates like `.str.contains()` or OR logic are filtered client-side. Correctness is always guaranteed.
             use_zero_based: If True, output 0-based half-open coordinates. If False, output 1-based closed coordinates. If None (default), uses the global configuration `datafusion.bio.coordinate_system_zero_based`.
+            n_rows: Stop after this many GTF records. If None (default), all records are read.
 
         !!! note
             By default, coordinates are output in **1-based closed** format. Use `use_zero_based=True` or set `pb.set_option(pb.POLARS_BIO_COORDINATE_SYSTEM_ZERO_BASED, True)` for 0-based half-open coordinates.
@@ -809,6 +844,8 @@ class IOOperations:
             use_zero_based,
         )
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         if zero_based is not None:
             set_coordinate_system(df, zero_based)
@@ -816,7 +853,7 @@ class IOOperations:
 
     @staticmethod
     def scan_gtf(
-        path: str,
+        path: Union[str, os.PathLike],
         attr_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
@@ -836,7 +873,7 @@ class IOOperations:
         different attribute syntax (``key "value"`` vs GFF's ``key=value``).
 
         Parameters:
-            path: The path to the GTF file.
+            path: The path to the GTF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             attr_fields: List of attribute field names to extract as separate columns.
                 If *None*, attributes will be kept as a nested structure.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
@@ -882,7 +919,7 @@ class IOOperations:
 
     @staticmethod
     def read_bam(
-        path: str,
+        path: Union[str, os.PathLike],
         tag_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
@@ -896,6 +933,7 @@ class IOOperations:
         infer_tag_types: bool = True,
         infer_tag_sample_size: int = 100,
         tag_type_hints: Optional[list[str]] = None,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a BAM file into a DataFrame.
@@ -907,7 +945,7 @@ class IOOperations:
             and [Automatic parallel partitioning](/polars-bio/features/#automatic-parallel-partitioning) for details.
 
         Parameters:
-            path: The path to the BAM file.
+            path: The path to the BAM file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             tag_fields: List of BAM tag names to include as columns (e.g., ["NM", "MD", "AS"]). If None, no optional tags are parsed (default). Common tags include: NM (edit distance), MD (mismatch string), AS (alignment score), XS (secondary alignment score), RG (read group), CB (cell barcode), UB (UMI barcode).
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large-scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large-scale operations, it is recommended to increase this value to 8 or even more.
@@ -921,6 +959,7 @@ class IOOperations:
             infer_tag_types: If True (default), sample the file to auto-detect types for custom/unknown tags. This prevents integer tags from being decoded as ASCII characters.
             infer_tag_sample_size: Number of records to sample for tag type inference (default: 100).
             tag_type_hints: Explicit SAM-style type hints for tags (e.g., ["pt:i", "ML:B:C", "FZ:B:S"]). Used as fallback when inference is disabled or a tag is not found in sampled records. Supported forms: TAG:TYPE, TAG:B, or TAG:B:SUBTYPE where TYPE is one of A, c, C, s, S, i, I, f, Z, H and SUBTYPE is one of c, C, s, S, i, I, f.
+            n_rows: Number of alignment records to read (default: None, all records).
 
         !!! note
             By default, coordinates are output in **1-based closed** format. Use `use_zero_based=True` or set `pb.set_option(pb.POLARS_BIO_COORDINATE_SYSTEM_ZERO_BASED, True)` for 0-based half-open coordinates.
@@ -943,6 +982,8 @@ class IOOperations:
         )
         # Get metadata before collecting (polars-config-meta doesn't preserve through collect)
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         # Set metadata on the collected DataFrame
         if zero_based is not None:
@@ -951,7 +992,7 @@ class IOOperations:
 
     @staticmethod
     def scan_bam(
-        path: str,
+        path: Union[str, os.PathLike],
         tag_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
@@ -976,7 +1017,7 @@ class IOOperations:
             and [Automatic parallel partitioning](/polars-bio/features/#automatic-parallel-partitioning) for details.
 
         Parameters:
-            path: The path to the BAM file.
+            path: The path to the BAM file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             tag_fields: List of BAM tag names to include as columns (e.g., ["NM", "MD", "AS"]). If None, no optional tags are parsed (default). Common tags include: NM (edit distance), MD (mismatch string), AS (alignment score), XS (secondary alignment score), RG (read group), CB (cell barcode), UB (UMI barcode).
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
@@ -1028,7 +1069,7 @@ class IOOperations:
 
     @staticmethod
     def read_cram(
-        path: str,
+        path: Union[str, os.PathLike],
         reference_path: str = None,
         tag_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
@@ -1043,6 +1084,7 @@ class IOOperations:
         infer_tag_types: bool = True,
         infer_tag_sample_size: int = 100,
         tag_type_hints: Optional[list[str]] = None,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a CRAM file into a DataFrame.
@@ -1054,7 +1096,7 @@ class IOOperations:
             and [Automatic parallel partitioning](/polars-bio/features/#automatic-parallel-partitioning) for details.
 
         Parameters:
-            path: The path to the CRAM file (local or cloud storage: S3, GCS, Azure Blob).
+            path: The path to the CRAM file (local or cloud storage: S3, GCS, Azure Blob). A `str` or an `os.PathLike` such as `pathlib.Path`.
             reference_path: Optional path to external FASTA reference file (**local path only**, cloud storage not supported). If not provided, the CRAM file must contain embedded reference sequences. The FASTA file must have an accompanying index file (.fai) in the same directory. Create the index using: `samtools faidx reference.fasta`
             tag_fields: List of CRAM tag names to include as columns (e.g., ["NM", "MD", "AS"]). If None, no optional tags are parsed (default). Common tags include: NM (edit distance), MD (mismatch string), AS (alignment score), XS (secondary alignment score), RG (read group), CB (cell barcode), UB (UMI barcode).
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
@@ -1069,6 +1111,7 @@ class IOOperations:
             infer_tag_types: If True (default), sample the file to auto-detect types for custom/unknown tags. This prevents integer tags from being decoded as ASCII characters.
             infer_tag_sample_size: Number of records to sample for tag type inference (default: 100).
             tag_type_hints: Explicit SAM-style type hints for tags (e.g., ["pt:i", "ML:B:C", "FZ:B:S"]). Used as fallback when inference is disabled or a tag is not found in sampled records. Supported forms: TAG:TYPE, TAG:B, or TAG:B:SUBTYPE where TYPE is one of A, c, C, s, S, i, I, f, Z, H and SUBTYPE is one of c, C, s, S, i, I, f.
+            n_rows: Number of alignment records to decode from the CRAM file (default: None, the whole file).
 
         !!! note
             By default, coordinates are output in **1-based closed** format. Use `use_zero_based=True` or set `pb.set_option(pb.POLARS_BIO_COORDINATE_SYSTEM_ZERO_BASED, True)` for 0-based half-open coordinates.
@@ -1153,6 +1196,8 @@ class IOOperations:
         )
         # Get metadata before collecting (polars-config-meta doesn't preserve through collect)
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         # Set metadata on the collected DataFrame
         if zero_based is not None:
@@ -1161,7 +1206,7 @@ class IOOperations:
 
     @staticmethod
     def scan_cram(
-        path: str,
+        path: Union[str, os.PathLike],
         reference_path: str = None,
         tag_fields: Union[list[str], None] = None,
         chunk_size: int = 8,
@@ -1187,7 +1232,7 @@ class IOOperations:
             and [Automatic parallel partitioning](/polars-bio/features/#automatic-parallel-partitioning) for details.
 
         Parameters:
-            path: The path to the CRAM file (local or cloud storage: S3, GCS, Azure Blob).
+            path: The path to the CRAM file (local or cloud storage: S3, GCS, Azure Blob). A `str` or an `os.PathLike` such as `pathlib.Path`.
             reference_path: Optional path to external FASTA reference file (**local path only**, cloud storage not supported). If not provided, the CRAM file must contain embedded reference sequences. The FASTA file must have an accompanying index file (.fai) in the same directory. Create the index using: `samtools faidx reference.fasta`
             tag_fields: List of CRAM tag names to include as columns (e.g., ["NM", "MD", "AS"]). If None, no optional tags are parsed (default). Common tags include: NM (edit distance), MD (mismatch string), AS (alignment score), XS (secondary alignment score), RG (read group), CB (cell barcode), UB (UMI barcode).
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
@@ -1488,7 +1533,7 @@ class IOOperations:
 
     @staticmethod
     def read_fastq(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1497,6 +1542,7 @@ class IOOperations:
         timeout: int = 300,
         compression_type: str = "auto",
         projection_pushdown: bool = True,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a FASTQ file into a DataFrame.
@@ -1507,7 +1553,7 @@ class IOOperations:
             and [Automatic parallel partitioning](/polars-bio/features/#automatic-parallel-partitioning) for details on parallel reads and supported compression types.
 
         Parameters:
-            path: The path to the FASTQ file.
+            path: The path to the FASTQ file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -1516,8 +1562,9 @@ class IOOperations:
             timeout: The timeout in seconds for reading the file from object storage.
             compression_type: The compression type of the FASTQ file. If not specified, it will be detected automatically based on the file extension. BGZF and GZIP compressions are supported ('bgz', 'gz').
             projection_pushdown: Enable column projection pushdown to optimize query performance by only reading the necessary columns at the DataFusion level.
+            n_rows: The maximum number of reads to load. If not specified, every read in the file is loaded.
         """
-        return IOOperations.scan_fastq(
+        lf = IOOperations.scan_fastq(
             path,
             chunk_size,
             concurrent_fetches,
@@ -1527,11 +1574,14 @@ class IOOperations:
             timeout,
             compression_type,
             projection_pushdown,
-        ).collect()
+        )
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
+        return lf.collect()
 
     @staticmethod
     def scan_fastq(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1550,7 +1600,7 @@ class IOOperations:
             and [Automatic parallel partitioning](/polars-bio/features/#automatic-parallel-partitioning) for details on parallel reads and supported compression types.
 
         Parameters:
-            path: The path to the FASTQ file.
+            path: The path to the FASTQ file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -1578,7 +1628,7 @@ class IOOperations:
 
     @staticmethod
     def read_pairs(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1589,6 +1639,7 @@ class IOOperations:
         projection_pushdown: bool = True,
         predicate_pushdown: bool = True,
         use_zero_based: Optional[bool] = None,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a Pairs (Hi-C) file into a DataFrame.
@@ -1602,7 +1653,7 @@ class IOOperations:
             and [Indexed reads](/polars-bio/features/#indexed-reads-predicate-pushdown) for details.
 
         Parameters:
-            path: The path to the Pairs file (.pairs, .pairs.gz, .pairs.bgz).
+            path: The path to the Pairs file (.pairs, .pairs.gz, .pairs.bgz). A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store.
             concurrent_fetches: The number of concurrent fetches when reading from an object store.
             allow_anonymous: Whether to allow anonymous access to object storage.
@@ -1613,6 +1664,7 @@ class IOOperations:
             projection_pushdown: Enable column projection pushdown to optimize query performance.
             predicate_pushdown: Enable predicate pushdown using index files (TBI) for efficient region-based filtering. Index files are auto-discovered (e.g., `file.pairs.gz.tbi`). Only simple predicates are pushed down (equality, comparisons, IN); complex predicates are filtered client-side. Correctness is always guaranteed.
             use_zero_based: If True, output 0-based half-open coordinates. If False, output 1-based closed coordinates. If None (default), uses the global configuration `datafusion.bio.coordinate_system_zero_based`.
+            n_rows: Maximum number of contact records to read. If None (default), all records are read.
 
         !!! note
             By default, coordinates are output in **1-based closed** format. Use `use_zero_based=True` or set `pb.set_option(pb.POLARS_BIO_COORDINATE_SYSTEM_ZERO_BASED, True)` for 0-based half-open coordinates.
@@ -1631,6 +1683,8 @@ class IOOperations:
             use_zero_based,
         )
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         if zero_based is not None:
             set_coordinate_system(df, zero_based)
@@ -1638,7 +1692,7 @@ class IOOperations:
 
     @staticmethod
     def scan_pairs(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1662,7 +1716,7 @@ class IOOperations:
             and [Indexed reads](/polars-bio/features/#indexed-reads-predicate-pushdown) for details.
 
         Parameters:
-            path: The path to the Pairs file (.pairs, .pairs.gz, .pairs.bgz).
+            path: The path to the Pairs file (.pairs, .pairs.gz, .pairs.bgz). A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store.
             concurrent_fetches: The number of concurrent fetches when reading from an object store.
             allow_anonymous: Whether to allow anonymous access to object storage.
@@ -1704,7 +1758,7 @@ class IOOperations:
 
     @staticmethod
     def read_bed(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1714,12 +1768,13 @@ class IOOperations:
         compression_type: str = "auto",
         projection_pushdown: bool = True,
         use_zero_based: Optional[bool] = None,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a BED file into a DataFrame.
 
         Parameters:
-            path: The path to the BED file.
+            path: The path to the BED file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -1729,6 +1784,7 @@ class IOOperations:
             compression_type: The compression type of the BED file. If not specified, it will be detected automatically based on the file extension. BGZF compressions is supported ('bgz').
             projection_pushdown: Enable column projection pushdown to optimize query performance by only reading the necessary columns at the DataFusion level.
             use_zero_based: If True, output 0-based half-open coordinates. If False, output 1-based closed coordinates. If None (default), uses the global configuration `datafusion.bio.coordinate_system_zero_based`.
+            n_rows: Maximum number of intervals to read. If None (default), the whole file is read.
 
         !!! Note
             Only **BED4** format is supported. It extends the basic BED format (BED3) by adding a name field, resulting in four columns: chromosome, start position, end position, and name.
@@ -1751,6 +1807,8 @@ class IOOperations:
         )
         # Get metadata before collecting (polars-config-meta doesn't preserve through collect)
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         # Set metadata on the collected DataFrame
         if zero_based is not None:
@@ -1759,7 +1817,7 @@ class IOOperations:
 
     @staticmethod
     def scan_bed(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1774,7 +1832,7 @@ class IOOperations:
         Lazily read a BED file into a LazyFrame.
 
         Parameters:
-            path: The path to the BED file.
+            path: The path to the BED file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -1818,7 +1876,7 @@ class IOOperations:
 
     @staticmethod
     def read_bigwig(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1829,6 +1887,7 @@ class IOOperations:
         projection_pushdown: bool = True,
         predicate_pushdown: bool = True,
         use_zero_based: Optional[bool] = None,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a BigWig file into a DataFrame.
@@ -1836,7 +1895,7 @@ class IOOperations:
         BigWig rows are exposed as ``chrom``, ``start``, ``end``, and ``value``.
 
         Parameters:
-            path: The path to the BigWig file.
+            path: The path to the BigWig file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -1847,6 +1906,7 @@ class IOOperations:
             projection_pushdown: Enable column projection pushdown optimization. When True, only requested columns are processed at the DataFusion execution level, improving performance and reducing memory usage.
             predicate_pushdown: Enable predicate pushdown on the genomic coordinate columns so range filters are evaluated at the DataFusion execution level.
             use_zero_based: Coordinate system override. BigWig is natively 0-based half-open; set to *False* to emit 1-based closed coordinates, or *None* to use the global default.
+            n_rows: Stop after this many intervals; *None* reads every interval in the file.
         """
         lf = IOOperations.scan_bigwig(
             path,
@@ -1862,6 +1922,8 @@ class IOOperations:
             use_zero_based,
         )
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         if zero_based is not None:
             set_coordinate_system(df, zero_based)
@@ -1869,7 +1931,7 @@ class IOOperations:
 
     @staticmethod
     def scan_bigwig(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1888,7 +1950,7 @@ class IOOperations:
         1-based closed coordinates.
 
         Parameters:
-            path: The path to the BigWig file.
+            path: The path to the BigWig file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -1927,7 +1989,7 @@ class IOOperations:
 
     @staticmethod
     def read_bigbed(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -1939,6 +2001,7 @@ class IOOperations:
         predicate_pushdown: bool = True,
         use_zero_based: Optional[bool] = None,
         schema: str = "auto",
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a BigBed file into a DataFrame.
@@ -1947,7 +2010,7 @@ class IOOperations:
         ``schema="rest"`` exposes the raw trailing fields in ``rest``.
 
         Parameters:
-            path: The path to the BigBed file.
+            path: The path to the BigBed file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -1959,6 +2022,7 @@ class IOOperations:
             predicate_pushdown: Enable predicate pushdown on the genomic coordinate columns so range filters are evaluated at the DataFusion execution level.
             use_zero_based: Coordinate system override. BigBed is natively 0-based half-open; set to *False* to emit 1-based closed coordinates, or *None* to use the global default.
             schema: Schema mode. ``"auto"`` exposes the supported autoSQL fields when available; ``"rest"`` exposes the raw trailing fields in a single ``rest`` column.
+            n_rows: Maximum number of BigBed entries to return; *None* returns them all.
         """
         lf = IOOperations.scan_bigbed(
             path,
@@ -1975,6 +2039,8 @@ class IOOperations:
             schema,
         )
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         if zero_based is not None:
             set_coordinate_system(df, zero_based)
@@ -1982,7 +2048,7 @@ class IOOperations:
 
     @staticmethod
     def scan_bigbed(
-        path: str,
+        path: Union[str, os.PathLike],
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
         allow_anonymous: bool = True,
@@ -2002,7 +2068,7 @@ class IOOperations:
         1-based closed coordinates.
 
         Parameters:
-            path: The path to the BigBed file.
+            path: The path to the BigBed file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
             allow_anonymous: [GCS, AWS S3] Whether to allow anonymous access to object storage.
@@ -2042,43 +2108,48 @@ class IOOperations:
         )
 
     @staticmethod
-    def read_table(path: str, schema: Dict = None, **kwargs) -> pl.DataFrame:
+    def read_table(
+        path: Union[str, os.PathLike], schema: Dict = None, **kwargs
+    ) -> pl.DataFrame:
         """
          Read a tab-delimited (i.e. BED) file into a Polars DataFrame.
          Tries to be compatible with Bioframe's [read_table](https://bioframe.readthedocs.io/en/latest/guide-io.html)
          but faster. Schema should follow the Bioframe's schema [format](https://github.com/open2c/bioframe/blob/2b685eebef393c2c9e6220dcf550b3630d87518e/bioframe/io/schemas.py#L174).
 
         Parameters:
-            path: The path to the file.
+            path: The path to the file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             schema: Schema should follow the Bioframe's schema [format](https://github.com/open2c/bioframe/blob/2b685eebef393c2c9e6220dcf550b3630d87518e/bioframe/io/schemas.py#L174).
+            **kwargs: Passed to [polars.scan_csv](https://docs.pola.rs/api/python/stable/reference/api/polars.scan_csv.html), e.g. `n_rows` to stop reading after this many rows.
         """
         return IOOperations.scan_table(path, schema, **kwargs).collect()
 
     @staticmethod
-    def scan_table(path: str, schema: Dict = None, **kwargs) -> pl.LazyFrame:
+    def scan_table(
+        path: Union[str, os.PathLike], schema: Dict = None, **kwargs
+    ) -> pl.LazyFrame:
         """
          Lazily read a tab-delimited (i.e. BED) file into a Polars LazyFrame.
          Tries to be compatible with Bioframe's [read_table](https://bioframe.readthedocs.io/en/latest/guide-io.html)
          but faster and lazy. Schema should follow the Bioframe's schema [format](https://github.com/open2c/bioframe/blob/2b685eebef393c2c9e6220dcf550b3630d87518e/bioframe/io/schemas.py#L174).
 
         Parameters:
-            path: The path to the file.
+            path: The path to the file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             schema: Schema should follow the Bioframe's schema [format](https://github.com/open2c/bioframe/blob/2b685eebef393c2c9e6220dcf550b3630d87518e/bioframe/io/schemas.py#L174).
         """
         df = pl.scan_csv(path, separator="\t", has_header=False, **kwargs)
         if schema is not None:
             columns = SCHEMAS[schema]
-            if len(columns) != len(df.collect_schema()):
+            n_input_columns = len(df.collect_schema())
+            if len(columns) != n_input_columns:
                 raise ValueError(
-                    f"Schema incompatible with the input. Expected {len(columns)} columns in a schema, got {len(df.collect_schema())} in the input data file. Please provide a valid schema."
+                    f"Schema incompatible with the input. Expected {len(columns)} columns in a schema, got {n_input_columns} in the input data file. Please provide a valid schema."
                 )
-            for i, c in enumerate(columns):
-                df = df.rename({f"column_{i + 1}": c})
+            df = df.rename({f"column_{i + 1}": c for i, c in enumerate(columns)})
         return df
 
     @staticmethod
     def describe_vcf(
-        path: str,
+        path: Union[str, os.PathLike],
         allow_anonymous: bool = True,
         enable_request_payer: bool = False,
         compression_type: str = "auto",
@@ -2087,11 +2158,12 @@ class IOOperations:
         Describe VCF INFO schema.
 
         Parameters:
-            path: The path to the VCF file.
+            path: The path to the VCF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             allow_anonymous: Whether to allow anonymous access to object storage (GCS and S3 supported).
             enable_request_payer: Whether to enable request payer for object storage. This is useful for reading files from AWS S3 buckets that require request payer.
             compression_type: The compression type of the VCF file. If not specified, it will be detected automatically..
         """
+        path = os.fspath(path)
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
             enable_request_payer=enable_request_payer,
@@ -2104,14 +2176,14 @@ class IOOperations:
         return py_describe_vcf(ctx, path, object_storage_options).to_polars()
 
     @staticmethod
-    def describe_vcf_zarr(path: str) -> pl.DataFrame:
+    def describe_vcf_zarr(path: Union[str, os.PathLike]) -> pl.DataFrame:
         """
         Describe VCF Zarr INFO and FORMAT schema.
 
         Parameters:
-            path: The path to the local VCF Zarr store directory.
+            path: The path to the local VCF Zarr store directory. A `str` or an `os.PathLike` such as `pathlib.Path`.
         """
-        return py_describe_vcf_zarr(ctx, path).to_polars()
+        return py_describe_vcf_zarr(ctx, os.fspath(path)).to_polars()
 
     @staticmethod
     def from_polars(name: str, df: Union[pl.DataFrame, pl.LazyFrame]) -> None:
@@ -2122,11 +2194,33 @@ class IOOperations:
             name: The name of the table.
             df: The Polars DataFrame.
         """
-        reader = (
-            df.to_arrow()
-            if isinstance(df, pl.DataFrame)
-            else df.collect().to_arrow().to_reader()
-        )
+        if isinstance(df, pl.DataFrame):
+            reader = df.to_arrow()
+        else:
+            # Stream the LazyFrame instead of collecting it first, so the full
+            # Polars result is never held alongside the registered table.
+            # Converting each batch with to_arrow() keeps the same Arrow types
+            # (e.g. LargeUtf8, not Utf8View) as the DataFrame path.
+            batches = (
+                batch
+                for chunk in df.collect_batches(engine="streaming")
+                for batch in chunk.to_arrow().to_batches()
+            )
+            first = next(batches, None)
+            if first is None:
+                reader = df.clear().collect().to_arrow()
+            else:
+                # The reader schema comes from real data: dictionary-encoded
+                # columns (Categorical/Enum) need not convert to the same type
+                # as the empty frame, so later batches are cast to match.
+                schema = first.schema
+                reader = pa.RecordBatchReader.from_batches(
+                    schema,
+                    (
+                        batch if batch.schema.equals(schema) else batch.cast(schema)
+                        for batch in itertools.chain((first,), batches)
+                    ),
+                )
         py_from_polars(ctx, name, reader)
 
     @staticmethod
@@ -2408,13 +2502,14 @@ class IOOperations:
 
     @staticmethod
     def read_sam(
-        path: str,
+        path: Union[str, os.PathLike],
         tag_fields: Union[list[str], None] = None,
         projection_pushdown: bool = True,
         use_zero_based: Optional[bool] = None,
         infer_tag_types: bool = True,
         infer_tag_sample_size: int = 100,
         tag_type_hints: Optional[list[str]] = None,
+        n_rows: Optional[int] = None,
     ) -> pl.DataFrame:
         """
         Read a SAM file into a DataFrame.
@@ -2424,7 +2519,7 @@ class IOOperations:
         from the file extension.
 
         Parameters:
-            path: The path to the SAM file.
+            path: The path to the SAM file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             tag_fields: List of SAM tag names to include as columns (e.g., ["NM", "MD", "AS"]).
                 If None, no optional tags are parsed (default).
             projection_pushdown: Enable column projection pushdown to optimize query performance.
@@ -2434,6 +2529,7 @@ class IOOperations:
             infer_tag_types: If True (default), sample the file to auto-detect types for custom/unknown tags.
             infer_tag_sample_size: Number of records to sample for tag type inference (default: 100).
             tag_type_hints: Explicit SAM-style type hints for tags (e.g., ["pt:i", "ML:B:C", "FZ:B:S"]). Supported forms: TAG:TYPE, TAG:B, or TAG:B:SUBTYPE where TYPE is one of A, c, C, s, S, i, I, f, Z, H and SUBTYPE is one of c, C, s, S, i, I, f.
+            n_rows: Number of records to read (default: None, all records).
 
         !!! note
             By default, coordinates are output in **1-based closed** format.
@@ -2448,6 +2544,8 @@ class IOOperations:
             tag_type_hints,
         )
         zero_based = lf.config_meta.get_metadata().get("coordinate_system_zero_based")
+        if n_rows is not None:
+            lf = lf.limit(n_rows)
         df = lf.collect()
         if zero_based is not None:
             set_coordinate_system(df, zero_based)
@@ -2455,7 +2553,7 @@ class IOOperations:
 
     @staticmethod
     def scan_sam(
-        path: str,
+        path: Union[str, os.PathLike],
         tag_fields: Union[list[str], None] = None,
         projection_pushdown: bool = True,
         use_zero_based: Optional[bool] = None,
@@ -2471,7 +2569,7 @@ class IOOperations:
         from the file extension.
 
         Parameters:
-            path: The path to the SAM file.
+            path: The path to the SAM file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             tag_fields: List of SAM tag names to include as columns (e.g., ["NM", "MD", "AS"]).
                 If None, no optional tags are parsed (default).
             projection_pushdown: Enable column projection pushdown to optimize query performance.
@@ -2706,6 +2804,57 @@ def _cleanse_fields(t: Union[list[str], None]) -> Union[list[str], None]:
     return [x.strip() for x in t]
 
 
+def _file_stamp(path: str) -> Optional[tuple]:
+    """Return (st_mtime_ns, st_size) for a local file, None for remote paths."""
+    try:
+        stat = os.stat(path)
+    except (OSError, ValueError):
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+@functools.lru_cache(maxsize=128)
+def _cached_vcf_info_fields(
+    path: str,
+    allow_anonymous: bool,
+    enable_request_payer: bool,
+    compression_type: str,
+    file_stamp: Optional[tuple] = None,
+) -> tuple:
+    """Return the INFO field names declared in a VCF header, memoized per path.
+
+    ``file_stamp`` (see ``_file_stamp``) is only part of the cache key, so
+    a local file rewritten in place is described again. Remote objects are
+    treated as immutable; use clear_vcf_header_cache() after overwriting one.
+    Failures are not cached, so a transient object store error is retried on
+    the next call.
+    """
+    object_storage_options = PyObjectStorageOptions(
+        allow_anonymous=allow_anonymous,
+        enable_request_payer=enable_request_payer,
+        chunk_size=8,
+        concurrent_fetches=1,
+        max_retries=1,
+        timeout=10,
+        compression_type=compression_type,
+    )
+    # Only the INFO names are needed: filter and project in DataFusion and read
+    # the single Arrow column instead of converting the whole describe frame.
+    vcf_schema_df = py_describe_vcf(ctx, path, object_storage_options)
+    names = (
+        vcf_schema_df.filter(vcf_schema_df.parse_sql_expr("field_type = 'INFO'"))
+        .select(vcf_schema_df.parse_sql_expr("name"))
+        .to_arrow_table()
+        .column(0)
+    )
+    return tuple(names.to_pylist())
+
+
+def clear_vcf_header_cache() -> None:
+    """Drop the memoized VCF header INFO fields used for table registration."""
+    _cached_vcf_info_fields.cache_clear()
+
+
 _FASTQ_COLUMNS = ["name", "description", "sequence", "quality_scores"]
 _FASTQ_REQUIRED_COLUMNS = ["name", "sequence", "quality_scores"]
 
@@ -2754,9 +2903,6 @@ def _write_file(
     Returns:
         The number of rows written.
     """
-    import json
-
-    from ._metadata import get_coordinate_system, get_metadata
 
     # Get metadata WITHOUT collecting (works for both DataFrame and LazyFrame)
     source_meta = None
@@ -2818,9 +2964,6 @@ def _write_file(
     # This works for filtered/transformed LazyFrames
     # NOTE: Filtering currently materializes all data - predicate pushdown to DataFusion not yet implemented
     if isinstance(df, pl.LazyFrame):
-        import pyarrow as pa
-        import pyarrow.compute as pc
-
         # Get streaming batches from Polars
         batches_iter = df.collect_batches(lazy=True, engine="streaming")
         stream = batches_iter._inner
@@ -2844,9 +2987,6 @@ def _write_bam_file(
     tag_type_overrides: Optional[Dict[str, str]] = None,
 ) -> int:
     """Internal helper for BAM/CRAM write with streaming."""
-    import json
-
-    from ._metadata import get_coordinate_system, get_metadata
 
     # Extract metadata
     source_meta = None
@@ -2908,119 +3048,71 @@ def _write_bam_file(
         return py_write_table(ctx, reader, path, output_format, write_options)
 
 
-def _apply_combined_pushdown_via_sql(
-    ctx,
-    table_name,
-    original_df,
-    predicate,
-    projected_columns,
-    predicate_pushdown,
-    projection_pushdown,
-):
-    """Apply both predicate and projection pushdown using SQL approach."""
-    from polars_bio.polars_bio import py_read_sql
-
-    # Build SQL query with combined optimizations
-    select_clause = "*"
-    if projection_pushdown and projected_columns:
-        select_clause = ", ".join([f'"{c}"' for c in projected_columns])
-
-    where_clause = ""
-    if predicate_pushdown and predicate is not None:
-        try:
-            # Use the proven regex-based predicate translation
-            where_clause = _build_sql_where_from_predicate_safe(predicate)
-        except Exception as e:
-            where_clause = ""
-
-    # No fallback - if we can't parse to SQL, just use projection only
-    # This keeps us in pure SQL mode for maximum performance
-
-    # Construct optimized SQL query
-    quoted_table = _quote_sql_identifier(table_name)
-    if where_clause:
-        sql = f"SELECT {select_clause} FROM {quoted_table} WHERE {where_clause}"
-    else:
-        sql = f"SELECT {select_clause} FROM {quoted_table}"
+# Patterns used by _build_sql_where_from_predicate_safe, compiled once at import.
+# String equality/inequality patterns (including empty strings).
+# Accept both with and without surrounding parentheses in Polars repr.
+_WHERE_STR_EQ_PATTERNS = [
+    re.compile(r'\(col\("([^"]+)"\)\)\s*==\s*\("([^"]*)"\)'),  # (col("x")) == ("v")
+    re.compile(r'col\("([^"]+)"\)\s*==\s*"([^"]*)"'),  # col("x") == "v"
+]
+
+# Numeric/float comparisons in both repr formats, "(col("x")) > (dyn int: 5)"
+# and "col("x") > 5", as a single alternation so one finditer pass finds them all.
+_WHERE_COMPARISON_PATTERN = re.compile(
+    r'\(col\("(?P<pcol>[^"]+)"\)\)\s*(?P<pop>>=|<=|!=|==|>|<)\s*'
+    r"\((?:dyn (?:int|float):\s*)?(?P<pval>[\d.]+)\)"
+    r'|col\("(?P<col>[^"]+)"\)\s*(?P<op>>=|<=|!=|==|>|<)\s*(?P<val>[\d.]+)'
+)
+_WHERE_SQL_OPS = {">": ">", "<": "<", ">=": ">=", "<=": "<=", "!=": "!=", "==": "="}
+
+# IN list pattern: col("x").is_in([v1, v2, ...]) and its value tokens
+_WHERE_IN_PATTERN = re.compile(r'col\("([^"]+)"\)\.is_in\(\[(.*?)\]\)')
+_WHERE_IN_TOKEN_PATTERN = re.compile(r"'(?:[^']*)'|\"(?:[^\"]*)\"|\d+(?:\.\d+)?")
 
-    # Execute with DataFusion - this leverages the proven 4x+ optimization
-    return py_read_sql(ctx, sql)
+# Collapse simple >= and <= pairs into BETWEEN
+_WHERE_BETWEEN_GE_LE = re.compile(
+    r'"([^"]+)"\s*>=\s*([\d.]+)\s*AND\s*"\1"\s*<=\s*([\d.]+)'
+)
+_WHERE_BETWEEN_LE_GE = re.compile(
+    r'"([^"]+)"\s*<=\s*([\d.]+)\s*AND\s*"\1"\s*>=\s*([\d.]+)'
+)
 
 
 def _build_sql_where_from_predicate_safe(predicate):
     """Build SQL WHERE clause by parsing all individual conditions and connecting with AND."""
-    import re
-
     pred_str = str(predicate).strip("[]")
 
     # Find all individual conditions in the nested structure
     conditions = []
 
-    # String equality/inequality patterns (including empty strings)
-    # Accept both with and without surrounding parentheses in Polars repr
-    str_eq_patterns = [
-        r'\(col\("([^"]+)"\)\)\s*==\s*\("([^"]*)"\)',  # (col("x")) == ("v")
-        r'col\("([^"]+)"\)\s*==\s*"([^"]*)"',  # col("x") == "v"
-    ]
-    for pat in str_eq_patterns:
-        for column, value in re.findall(pat, pred_str):
-            conditions.append(f"\"{column}\" = '{value}'")
-
-    # Numeric comparison patterns (handle both formats: with and without "dyn int:")
-    numeric_patterns = [
-        (r'\(col\("([^"]+)"\)\)\s*>\s*\((?:dyn int:\s*)?(\d+)\)', ">"),
-        (r'\(col\("([^"]+)"\)\)\s*<\s*\((?:dyn int:\s*)?(\d+)\)', "<"),
-        (r'\(col\("([^"]+)"\)\)\s*>=\s*\((?:dyn int:\s*)?(\d+)\)', ">="),
-        (r'\(col\("([^"]+)"\)\)\s*<=\s*\((?:dyn int:\s*)?(\d+)\)', "<="),
-        (r'\(col\("([^"]+)"\)\)\s*!=\s*\((?:dyn int:\s*)?(\d+)\)', "!="),
-        (r'\(col\("([^"]+)"\)\)\s*==\s*\((?:dyn int:\s*)?(\d+)\)', "="),
-        (r'col\("([^"]+)"\)\s*>\s*(\d+)', ">"),
-        (r'col\("([^"]+)"\)\s*<\s*(\d+)', "<"),
-        (r'col\("([^"]+)"\)\s*>=\s*(\d+)', ">="),
-        (r'col\("([^"]+)"\)\s*<=\s*(\d+)', "<="),
-        (r'col\("([^"]+)"\)\s*!=\s*(\d+)', "!="),
-        (r'col\("([^"]+)"\)\s*==\s*(\d+)', "="),
-    ]
-
-    for pattern, op in numeric_patterns:
-        matches = re.findall(pattern, pred_str)
-        for column, value in matches:
-            conditions.append(f'"{column}" {op} {value}')
-
-    # Float comparison patterns (handle both formats: with and without "dyn float:")
-    float_patterns = [
-        (r'\(col\("([^"]+)"\)\)\s*>\s*\((?:dyn float:\s*)?([\d.]+)\)', ">"),
-        (r'\(col\("([^"]+)"\)\)\s*<\s*\((?:dyn float:\s*)?([\d.]+)\)', "<"),
-        (r'\(col\("([^"]+)"\)\)\s*>=\s*\((?:dyn float:\s*)?([\d.]+)\)', ">="),
-        (r'\(col\("([^"]+)"\)\)\s*<=\s*\((?:dyn float:\s*)?([\d.]+)\)', "<="),
-        (r'\(col\("([^"]+)"\)\)\s*!=\s*\((?:dyn float:\s*)?([\d.]+)\)', "!="),
-        (r'\(col\("([^"]+)"\)\)\s*==\s*\((?:dyn float:\s*)?([\d.]+)\)', "="),
-        (r'col\("([^"]+)"\)\s*>\s*([\d.]+)', ">"),
-        (r'col\("([^"]+)"\)\s*<\s*([\d.]+)', "<"),
-        (r'col\("([^"]+)"\)\s*>=\s*([\d.]+)', ">="),
-        (r'col\("([^"]+)"\)\s*<=\s*([\d.]+)', "<="),
-        (r'col\("([^"]+)"\)\s*!=\s*([\d.]+)', "!="),
-        (r'col\("([^"]+)"\)\s*==\s*([\d.]+)', "="),
-    ]
+    for pat in _WHERE_STR_EQ_PATTERNS:
+        for column, value in pat.findall(pred_str):
+            conditions.append(
+                f"{_quote_sql_identifier(column)} = {_quote_sql_string(value)}"
+            )
 
-    for pattern, op in float_patterns:
-        matches = re.findall(pattern, pred_str)
-        for column, value in matches:
-            conditions.append(f'"{column}" {op} {value}')
+    for match in _WHERE_COMPARISON_PATTERN.finditer(pred_str):
+        if match.group("pcol") is not None:
+            column, op, value = match.group("pcol", "pop", "pval")
+        else:
+            column, op, value = match.group("col", "op", "val")
+        conditions.append(
+            f"{_quote_sql_identifier(column)} {_WHERE_SQL_OPS[op]} {value}"
+        )
 
-    # IN list pattern: col("x").is_in([v1, v2, ...])
-    in_matches = re.findall(r'col\("([^"]+)"\)\.is_in\(\[(.*?)\]\)', pred_str)
-    for column, values_str in in_matches:
+    for column, values_str in _WHERE_IN_PATTERN.findall(pred_str):
         # Tokenize values: quoted strings or numbers
-        tokens = re.findall(r"'(?:[^']*)'|\"(?:[^\"]*)\"|\d+(?:\.\d+)?", values_str)
+        tokens = _WHERE_IN_TOKEN_PATTERN.findall(values_str)
         items = []
         for t in tokens:
-            if t.startswith('"') and t.endswith('"'):
-                items.append("'" + t[1:-1] + "'")
+            if t[0] in "'\"":
+                items.append(_quote_sql_string(t[1:-1]))
             else:
                 items.append(t)
         if items:
-            conditions.append(f'"{column}" IN ({", ".join(items)})')
+            conditions.append(
+                f'{_quote_sql_identifier(column)} IN ({", ".join(items)})'
+            )
 
     # Join all conditions with AND
     if conditions:
@@ -3032,22 +3124,8 @@ def _build_sql_where_from_predicate_safe(predicate):
             .replace("[ ", "")
             .replace(" ]", "")
         )
-        # Collapse simple >= and <= pairs into BETWEEN when possible
-        try:
-            import re as _re
-
-            where = _re.sub(
-                r'"([^"]+)"\s*>=\s*([\d.]+)\s*AND\s*"\1"\s*<=\s*([\d.]+)',
-                r'"\1" BETWEEN \2 AND \3',
-                where,
-            )
-            where = _re.sub(
-                r'"([^"]+)"\s*<=\s*([\d.]+)\s*AND\s*"\1"\s*>=\s*([\d.]+)',
-                r'"\1" BETWEEN \3 AND \2',
-                where,
-            )
-        except Exception:
-            pass
+        where = _WHERE_BETWEEN_GE_LE.sub(r'"\1" BETWEEN \2 AND \3', where)
+        where = _WHERE_BETWEEN_LE_GE.sub(r'"\1" BETWEEN \3 AND \2', where)
         return where
 
     return ""
@@ -3063,8 +3141,6 @@ def _lazy_scan(
     read_options: ReadOptions = None,
 ) -> pl.LazyFrame:
     # Handle both PyArrow schema (new streaming path) and DataFusion DataFrame (old SQL path)
-    import pyarrow as pa
-
     df_for_stream = None  # Used for SQL path
 
     # Check if it's a DataFusion DataFrame by checking for schema() method
@@ -3103,11 +3179,6 @@ def _lazy_scan(
         n_rows: Union[int, None],
         _batch_size: Union[int, None],
     ) -> Iterator[pl.DataFrame]:
-        from polars_bio.polars_bio import py_read_table, py_register_table
-
-        from .context import ctx as _ctx
-        from .pushdown import apply_predicate_pushdown, apply_projection_pushdown
-
         table_refreshed = False
 
         # === GFF/GTF pre-step ===
@@ -3115,14 +3186,14 @@ def _lazy_scan(
         # that can be parsed into individual columns. Unlike BAM/VCF/CRAM which
         # have fixed schemas, attribute columns must be configured at table
         # registration time. If projection requests specific attribute columns
-        # we must re-register the table with those attr_fields.
+        # we must re-register the table with those attr_fields. A source bound
+        # to an already-projected DataFusion DataFrame never re-registers.
         table_to_query = table_name
-        if input_format in (InputFormat.Gff, InputFormat.Gtf) and file_path is not None:
-            from polars_bio.polars_bio import GffReadOptions
-            from polars_bio.polars_bio import GtfReadOptions as _GtfReadOptions
-            from polars_bio.polars_bio import PyObjectStorageOptions
-            from polars_bio.polars_bio import ReadOptions as _ReadOptions
-
+        if (
+            input_format in (InputFormat.Gff, InputFormat.Gtf)
+            and file_path is not None
+            and df_for_stream is None
+        ):
             is_gff = input_format == InputFormat.Gff
             opts_field = "gff_read_options" if is_gff else "gtf_read_options"
 
@@ -3132,18 +3203,7 @@ def _lazy_scan(
                 else []
             )
 
-            STATIC = {
-                "chrom",
-                "start",
-                "end",
-                "type",
-                "source",
-                "score",
-                "strand",
-                "phase",
-                "attributes",
-            }
-            attr_fields = [c for c in requested_cols if c not in STATIC]
+            attr_fields = [c for c in requested_cols if c not in _GFF_STATIC_COLUMNS]
 
             # Derive zero_based from read_options
             zero_based = False
@@ -3157,8 +3217,6 @@ def _lazy_scan(
                 except Exception:
                     pass
 
-            obj = _extract_py_object_storage_options(read_options)
-
             # When both the raw nested ``attributes`` column and parsed fields
             # are requested, use the reader's "attributes" sentinel to emit both
             # from a single registration.
@@ -3171,26 +3229,17 @@ def _lazy_scan(
             else:
                 _attr = []
 
-            if is_gff:
-                fmt_opts = GffReadOptions(
-                    attr_fields=_attr,
-                    object_storage_options=obj,
-                    zero_based=zero_based,
-                )
-                ropts = _ReadOptions(gff_read_options=fmt_opts)
-            else:
-                fmt_opts = _GtfReadOptions(
-                    attr_fields=_attr,
-                    object_storage_options=obj,
-                    zero_based=zero_based,
-                )
-                ropts = _ReadOptions(gtf_read_options=fmt_opts)
-
             if projection_pushdown and requested_cols:
-                table_obj = py_register_table(
-                    _ctx, file_path, table_name, input_format, ropts
+                # Polars may invoke this source several times while (re)planning
+                # a query; reuse the table registered for this attribute shape
+                # instead of re-opening the file on every call.
+                table_to_query = _register_annotation_table_cached(
+                    file_path,
+                    input_format,
+                    _attr,
+                    zero_based,
+                    _extract_py_object_storage_options(read_options),
                 )
-                table_to_query = table_obj.name
                 table_refreshed = True
 
         # === Unified path for ALL formats ===
@@ -3207,9 +3256,9 @@ def _lazy_scan(
                 and table_to_query is not None
             ):
                 py_register_table(
-                    _ctx, file_path, table_to_query, input_format, read_options
+                    ctx, file_path, table_to_query, input_format, read_options
                 )
-            query_df = py_read_table(_ctx, table_to_query)
+            query_df = py_read_table(ctx, table_to_query)
 
         # 2. Predicate pushdown (optimization only; the client-side filter below
         #    is the source of truth). The shared helper pushes the faithfully
@@ -3239,6 +3288,8 @@ def _lazy_scan(
 
         # 5. Stream with safety net
         df_stream = query_df.execute_stream()
+        from tqdm.auto import tqdm
+
         progress_bar = tqdm(unit="rows")
         remaining = int(n_rows) if n_rows is not None else None
         for r in df_stream:
@@ -3286,8 +3337,6 @@ def _store_py_object_storage_options(read_options, obj_opts):
 
 def _extract_py_object_storage_options(read_options):
     """Extract stored PyObjectStorageOptions from read_options, or return defaults."""
-    from polars_bio.polars_bio import PyObjectStorageOptions
-
     stored = _object_storage_options_store.get(id(read_options))
     if stored is not None:
         return stored
@@ -3302,35 +3351,117 @@ def _extract_py_object_storage_options(read_options):
     )
 
 
+# Bounded LRU of GFF/GTF tables registered for a specific attribute projection,
+# keyed by everything that shapes the registered provider. PyO3 option objects
+# are not hashable, so ``functools.lru_cache`` cannot wrap the registration
+# directly; the key is built from their plain field values instead. Each entry
+# holds (file stamp, table name); polars may run sources from several threads,
+# so every access goes through the lock.
+_ANNOTATION_TABLE_CACHE_SIZE = 32
+_annotation_table_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+_annotation_table_ids = itertools.count()
+_annotation_table_lock = threading.Lock()
+
+
+def _object_storage_options_key(obj) -> tuple:
+    """Return a hashable key for a PyObjectStorageOptions instance."""
+    return (
+        obj.allow_anonymous,
+        obj.enable_request_payer,
+        obj.compression_type,
+        obj.chunk_size,
+        obj.concurrent_fetches,
+        obj.max_retries,
+        obj.timeout,
+    )
+
+
+def _register_annotation_table_cached(
+    file_path: str,
+    input_format: InputFormat,
+    attr_fields: Optional[list[str]],
+    zero_based: bool,
+    object_storage_options: PyObjectStorageOptions,
+) -> str:
+    """Register a GFF/GTF table for ``attr_fields`` once and return its name.
+
+    Registrations use dedicated table names so they never clobber the base
+    table of a LazyFrame. A local file rewritten in place (see ``_file_stamp``)
+    is registered again; remote objects are treated as immutable. Replaced and
+    least recently used tables are deregistered, and names are never reused,
+    so a name handed out earlier can only fail to resolve, never point at a
+    different file.
+    """
+    is_gff = input_format == InputFormat.Gff
+    format_key = "gff" if is_gff else "gtf"
+    key = (
+        format_key,
+        file_path,
+        tuple(attr_fields) if attr_fields is not None else None,
+        zero_based,
+        _object_storage_options_key(object_storage_options),
+    )
+    file_stamp = _file_stamp(file_path)
+
+    with _annotation_table_lock:
+        cached = _annotation_table_cache.get(key)
+        if cached is not None:
+            cached_stamp, table_name = cached
+            if cached_stamp == file_stamp:
+                _annotation_table_cache.move_to_end(key)
+                return table_name
+            del _annotation_table_cache[key]
+            ctx.deregister_table(table_name)
+
+        if is_gff:
+            read_options = ReadOptions(
+                gff_read_options=GffReadOptions(
+                    attr_fields=attr_fields,
+                    object_storage_options=object_storage_options,
+                    zero_based=zero_based,
+                )
+            )
+        else:
+            read_options = ReadOptions(
+                gtf_read_options=GtfReadOptions(
+                    attr_fields=attr_fields,
+                    object_storage_options=object_storage_options,
+                    zero_based=zero_based,
+                )
+            )
+
+        table_name = f"_pb_{format_key}_attr_{next(_annotation_table_ids)}"
+        py_register_table(ctx, file_path, table_name, input_format, read_options)
+        _annotation_table_cache[key] = (file_stamp, table_name)
+        if len(_annotation_table_cache) > _ANNOTATION_TABLE_CACHE_SIZE:
+            _, (_, evicted_name) = _annotation_table_cache.popitem(last=False)
+            ctx.deregister_table(evicted_name)
+        return table_name
+
+
 def _extract_column_names_from_expr(with_columns: Union[pl.Expr, list]) -> "List[str]":
     """Extract column names from Polars expressions."""
     if with_columns is None:
         return []
-
-    # Handle different types of with_columns input
-    if hasattr(with_columns, "__iter__") and not isinstance(with_columns, str):
-        # It's a list of expressions or strings
-        column_names = []
-        for item in with_columns:
-            if isinstance(item, str):
-                column_names.append(item)
-            elif hasattr(item, "meta") and hasattr(item.meta, "output_name"):
-                # Polars expression with output name
-                try:
-                    column_names.append(item.meta.output_name())
-                except Exception:
-                    pass
-        return column_names
-    elif isinstance(with_columns, str):
+    if isinstance(with_columns, str):
         return [with_columns]
-    elif hasattr(with_columns, "meta") and hasattr(with_columns.meta, "output_name"):
-        # Single Polars expression
-        try:
-            return [with_columns.meta.output_name()]
-        except Exception:
-            pass
+    if isinstance(with_columns, pl.Expr):
+        with_columns = (with_columns,)
+    elif not hasattr(with_columns, "__iter__"):
+        # Unrecognised input: no names, so the caller selects client-side
+        return []
 
-    return []
+    column_names = []
+    for item in with_columns:
+        if isinstance(item, str):
+            column_names.append(item)
+        elif isinstance(item, pl.Expr):
+            # Polars expression with output name
+            try:
+                column_names.append(item.meta.output_name())
+            except Exception:
+                pass
+    return column_names
 
 
 def _extract_vcf_metadata_from_schema(schema) -> dict:
@@ -3427,8 +3558,6 @@ def _extract_vcf_header_extras(schema) -> dict:
         - bio.vcf.alternative_alleles: JSON array of AltAlleleMetadata
         - bio.vcf.samples: JSON array of sample names (redundant with column-based extraction)
     """
-    import json
-
     extras = {}
     schema_meta = schema.metadata or {}
 
@@ -3464,6 +3593,25 @@ def _extract_vcf_header_extras(schema) -> dict:
     return extras
 
 
+# InputFormat -> metadata format identifier. PyO3 enums are not hashable, so
+# the map is keyed by the enum's integer discriminant.
+_FORMAT_STRINGS = {
+    int(InputFormat.Vcf): "vcf",
+    int(InputFormat.VcfZarr): "vcf_zarr",
+    int(InputFormat.Sam): "sam",
+    int(InputFormat.Bam): "bam",
+    int(InputFormat.Cram): "cram",
+    int(InputFormat.Fastq): "fastq",
+    int(InputFormat.Fasta): "fasta",
+    int(InputFormat.Gtf): "gtf",
+    int(InputFormat.Gff): "gff",
+    int(InputFormat.BigWig): "bigwig",
+    int(InputFormat.BigBed): "bigbed",
+    int(InputFormat.Bed): "bed",
+    int(InputFormat.Pairs): "pairs",
+}
+
+
 def _format_to_string(input_format: InputFormat) -> str:
     """Convert InputFormat enum to string identifier for metadata storage.
 
@@ -3471,40 +3619,61 @@ def _format_to_string(input_format: InputFormat) -> str:
         input_format: InputFormat enum value
 
     Returns:
-        String identifier (e.g., "vcf", "fastq", "bam")
+        String identifier (e.g., "vcf", "fastq", "bam"), or "unknown"
     """
-    # Use string comparison since InputFormat is not hashable
-    format_str = str(input_format)
-    if "VcfZarr" in format_str:
-        return "vcf_zarr"
-    elif "Vcf" in format_str:
-        return "vcf"
-    elif "Sam" in format_str:
-        return "sam"
-    elif "Bam" in format_str:
-        return "bam"
-    elif "Cram" in format_str:
-        return "cram"
-    elif "Fastq" in format_str:
-        return "fastq"
-    elif "Fasta" in format_str:
-        return "fasta"
-    elif "Gtf" in format_str:
-        return "gtf"
-    elif "Gff" in format_str:
-        return "gff"
-    # NOTE: BigWig/BigBed must be checked before Bed — "Bed" is a substring of
-    # "BigBed", so reordering these branches would silently misclassify BigBed as bed.
-    elif "BigWig" in format_str:
-        return "bigwig"
-    elif "BigBed" in format_str:
-        return "bigbed"
-    elif "Bed" in format_str:
-        return "bed"
-    elif "Pairs" in format_str:
-        return "pairs"
+    return _FORMAT_STRINGS.get(int(input_format), "unknown")
+
+
+# Metadata keys extract_all_schema_metadata() can parse into a format-specific
+# header (see metadata_extractors._extract_format_specific_metadata).
+_HEADER_METADATA_FORMATS = frozenset({"vcf", "fastq", "bam", "gff"})
+# Parsed VCF metadata fields exposed in the source header.
+_VCF_HEADER_KEYS = (
+    "info_fields",
+    "format_fields",
+    "sample_names",
+    "version",
+    "contigs",
+    "filters",
+    "alt_definitions",
+)
+
+
+def _build_header_metadata(schema, format_str: str, table_name: str) -> dict:
+    """Build the user-facing source header for a registered table's schema."""
+    # SAM and CRAM use the same schema metadata keys as BAM (bio.bam.*),
+    # so look up "bam" in format_specific when reading SAM or CRAM files.
+    if format_str == "vcf_zarr":
+        metadata_key = "vcf"
     else:
-        return "unknown"
+        metadata_key = "bam" if format_str in ("sam", "cram") else format_str
+
+    # Build format-specific header metadata for backward compatibility
+    header_metadata = None
+
+    # Other formats have no format-specific parser, so walking the schema
+    # metadata would only produce a header we throw away.
+    if metadata_key in _HEADER_METADATA_FORMATS:
+        # Only the format-specific part of the extraction is kept
+        from polars_bio.metadata_extractors import extract_all_schema_metadata
+
+        format_specific = extract_all_schema_metadata(schema).get("format_specific", {})
+        if metadata_key == "vcf" and "vcf" in format_specific:
+            vcf_meta = format_specific["vcf"]
+            header_metadata = {key: vcf_meta.get(key) for key in _VCF_HEADER_KEYS}
+        elif metadata_key in format_specific:
+            # FASTQ, BAM (also SAM/CRAM via the "bam" key) and GFF
+            header_metadata = format_specific[metadata_key]
+
+    # Note: We don't store _full_metadata to avoid duplication
+    # All relevant metadata is already parsed into user-friendly fields
+    # (info_fields, format_fields, sample_names, version, etc.)
+
+    # Store DataFusion table name for debugging
+    if header_metadata is None:
+        header_metadata = {}
+    header_metadata["_datafusion_table_name"] = table_name
+    return header_metadata
 
 
 def _read_file(
@@ -3515,61 +3684,15 @@ def _read_file(
     predicate_pushdown: bool = False,
     zero_based: bool = True,
 ) -> pl.LazyFrame:
+    # Accept pathlib.Path and other os.PathLike objects; the native layer
+    # and the source metadata work with plain strings.
+    path = os.fspath(path)
     table = py_register_table(ctx, path, None, input_format, read_options)
 
     # Get schema WITHOUT materializing data - critical for large files!
     schema = py_get_table_schema(ctx, table.name)
-
-    # Extract ALL metadata from schema (works for all formats!)
-    from polars_bio.metadata_extractors import extract_all_schema_metadata
-
-    full_metadata = extract_all_schema_metadata(schema)
-
-    # Build format-specific header metadata for backward compatibility
-    header_metadata = None
     format_str = _format_to_string(input_format)
 
-    # Extract format-specific metadata from the comprehensive extraction
-    format_specific = full_metadata.get("format_specific", {})
-
-    # SAM and CRAM use the same schema metadata keys as BAM (bio.bam.*),
-    # so look up "bam" in format_specific when reading SAM or CRAM files.
-    if format_str == "vcf_zarr":
-        metadata_key = "vcf"
-    else:
-        metadata_key = "bam" if format_str in ("sam", "cram") else format_str
-
-    if metadata_key in format_specific:
-        # Use the parsed format-specific metadata
-        if metadata_key == "vcf":
-            vcf_meta = format_specific["vcf"]
-            header_metadata = {
-                "info_fields": vcf_meta.get("info_fields"),
-                "format_fields": vcf_meta.get("format_fields"),
-                "sample_names": vcf_meta.get("sample_names"),
-                "version": vcf_meta.get("version"),
-                "contigs": vcf_meta.get("contigs"),
-                "filters": vcf_meta.get("filters"),
-                "alt_definitions": vcf_meta.get("alt_definitions"),
-            }
-        elif metadata_key in [
-            "fastq",
-            "bam",
-            "gff",
-            "gtf",
-            "fasta",
-            "bed",
-            "cram",
-            "bigwig",
-            "bigbed",
-        ]:
-            # For other formats (including SAM via "bam" key), include their specific metadata
-            header_metadata = format_specific.get(metadata_key, {})
-
-    # Note: We don't store _full_metadata to avoid duplication
-    # All relevant metadata is already parsed into user-friendly fields
-    # (info_fields, format_fields, sample_names, version, etc.)
-
     lf = _lazy_scan(
         schema,
         projection_pushdown,
@@ -3583,25 +3706,20 @@ def _read_file(
     # Set coordinate system metadata
     set_coordinate_system(lf, zero_based)
 
-    # Set source metadata (replaces old VCF-specific metadata setting)
-    from polars_bio._metadata import set_source_metadata
-
-    format_str = _format_to_string(input_format)
-
-    # Store DataFusion table name for debugging
-    if header_metadata is None:
-        header_metadata = {}
-    header_metadata["_datafusion_table_name"] = table.name
-
-    set_source_metadata(lf, format=format_str, path=path, header=header_metadata)
+    # Set source metadata (replaces old VCF-specific metadata setting).
+    # config_meta is serialized to JSON by write_parquet, so the header is
+    # stored as a plain string rather than a deferred object.
+    set_source_metadata(
+        lf,
+        format=format_str,
+        path=path,
+        header=_build_header_metadata(schema, format_str, table.name),
+    )
 
     # Wrap GFF/GTF LazyFrames with projection-aware wrapper for consistent attribute field handling
-    if input_format == InputFormat.Gff:
-        return GffLazyFrameWrapper(
-            lf, path, read_options, projection_pushdown, predicate_pushdown
-        )
-    if input_format == InputFormat.Gtf:
-        return GtfLazyFrameWrapper(
+    wrapper_cls = _ANNOTATION_WRAPPERS.get(format_str)
+    if wrapper_cls is not None:
+        return wrapper_cls(
             lf, path, read_options, projection_pushdown, predicate_pushdown
         )
 
@@ -3632,6 +3750,20 @@ class AnnotationLazyFrameWrapper:
     }
     _PRESERVE_DEFERRED_PREDICATE = object()
 
+    # Every filter()/select() returns a new wrapper; skip the per-instance dict.
+    __slots__ = (
+        "_base_lf",
+        "_file_path",
+        "_read_options",
+        "_projection_pushdown",
+        "_predicate_pushdown",
+        "_format_type",
+        "_config",
+        "_deferred_predicate",
+        "_predicate_columns",
+        "_registration_params_cache",
+    )
+
     def __init__(
         self,
         base_lf: pl.LazyFrame,
@@ -3650,6 +3782,12 @@ class AnnotationLazyFrameWrapper:
         self._format_type = format_type
         self._config = self._FORMAT_CONFIG[format_type]
         self._deferred_predicate = deferred_predicate
+        # Root column names of the deferred predicate, resolved on first use.
+        # filter() returns a new wrapper, so this never needs invalidation.
+        self._predicate_columns: Optional[list[str]] = None
+        # (zero_based, PyObjectStorageOptions) for re-registration, resolved on
+        # first use and handed down the chain since read_options never change.
+        self._registration_params_cache: Optional[tuple] = None
 
     def _make_wrapper(
         self,
@@ -3659,7 +3797,7 @@ class AnnotationLazyFrameWrapper:
         deferred_predicate=_PRESERVE_DEFERRED_PREDICATE,
     ):
         """Create a new wrapper of the same concrete type."""
-        return type(self)(
+        wrapper = type(self)(
             base_lf,
             self._file_path,
             self._read_options,
@@ -3679,57 +3817,66 @@ class AnnotationLazyFrameWrapper:
                 else deferred_predicate
             ),
         )
+        wrapper._registration_params_cache = self._registration_params_cache
+        return wrapper
+
+    def _registration_params(self):
+        """Return (zero_based, object storage options) from the read options."""
+        if self._registration_params_cache is None:
+            # Pull zero_based from original read options
+            zero_based = False
+            try:
+                gopt = getattr(self._read_options, self._config["opts_field"], None)
+                if gopt is not None:
+                    zb = getattr(gopt, "zero_based", None)
+                    if zb is not None:
+                        zero_based = zb
+            except Exception:
+                pass
+            self._registration_params_cache = (
+                zero_based,
+                _extract_py_object_storage_options(self._read_options),
+            )
+        return self._registration_params_cache
 
     def select(self, exprs):
+        predicate_columns = self._extract_predicate_column_names()
+
+        # Fast path: plain names of flat static columns (the common
+        # ``select(["chrom", "start", "end"])`` call) never need a
+        # re-registration, so skip the expression introspection below.
+        if isinstance(exprs, str):
+            exprs_names = (exprs,)
+        elif isinstance(exprs, (list, tuple)):
+            exprs_names = exprs
+        else:
+            exprs_names = None
+        if (
+            exprs_names is not None
+            and all(
+                isinstance(e, str) and e in _GFF_FLAT_STATIC_COLUMNS
+                for e in exprs_names
+            )
+            and _GFF_STATIC_COLUMNS.issuperset(predicate_columns)
+        ):
+            return self._make_wrapper(self._base_lf.select(exprs))
+
         # Source columns the projection needs (root names, NOT output names).
         # An aliased/computed expression like (pl.col("start") + 1).alias("s1")
         # needs the SOURCE column "start"; the alias/computation is applied
         # client-side over the original ``exprs`` and must never be mistaken for
         # a (here: attribute) column name to re-register the reader with.
-        from .pushdown import extract_source_columns
-
         columns, _proj_complete = extract_source_columns(exprs)
 
-        STATIC = {
-            "chrom",
-            "start",
-            "end",
-            "type",
-            "source",
-            "score",
-            "strand",
-            "phase",
-            "attributes",
-        }
-        predicate_columns = self._extract_predicate_column_names()
         scan_columns = list(dict.fromkeys(columns + predicate_columns))
-        attr_cols = [c for c in scan_columns if c not in STATIC]
+        attr_cols = [c for c in scan_columns if c not in _GFF_STATIC_COLUMNS]
 
         # If selecting attribute fields, run one-shot SQL projection with proper attr_fields
         if columns and (attr_cols or "attributes" in columns):
-            from polars_bio.polars_bio import GffReadOptions
-            from polars_bio.polars_bio import GtfReadOptions as _GtfReadOptions
-            from polars_bio.polars_bio import InputFormat as _InputFormat
-            from polars_bio.polars_bio import ReadOptions as _ReadOptions
-            from polars_bio.polars_bio import py_read_table, py_register_table
-
-            from .context import ctx
-
             is_gff = self._format_type == "gff"
-            input_fmt = _InputFormat.Gff if is_gff else _InputFormat.Gtf
-
-            # Pull zero_based from original read options
-            zero_based = False
-            try:
-                gopt = getattr(self._read_options, self._config["opts_field"], None)
-                if gopt is not None:
-                    zb = getattr(gopt, "zero_based", None)
-                    if zb is not None:
-                        zero_based = zb
-            except Exception:
-                pass
+            input_fmt = InputFormat.Gff if is_gff else InputFormat.Gtf
 
-            obj = _extract_py_object_storage_options(self._read_options)
+            zero_based, obj = self._registration_params()
 
             # ``scan_columns`` (projection + deferred-predicate roots) may need
             # both the raw nested ``attributes`` column and parsed attribute
@@ -3749,28 +3896,15 @@ class AnnotationLazyFrameWrapper:
             else:
                 _attr = []
 
-            if is_gff:
-                fmt_opts = GffReadOptions(
-                    attr_fields=_attr,
-                    object_storage_options=obj,
-                    zero_based=zero_based,
-                )
-                ropts = _ReadOptions(gff_read_options=fmt_opts)
-            else:
-                fmt_opts = _GtfReadOptions(
-                    attr_fields=_attr,
-                    object_storage_options=obj,
-                    zero_based=zero_based,
-                )
-                ropts = _ReadOptions(gtf_read_options=fmt_opts)
-
-            table = py_register_table(ctx, self._file_path, None, input_fmt, ropts)
+            # Chained or repeated projections of the same file reuse one
+            # registration instead of re-opening the file and its header.
+            table_name = _register_annotation_table_cached(
+                self._file_path, input_fmt, _attr, zero_based, obj
+            )
 
-            query_df = py_read_table(ctx, table.name)
+            query_df = py_read_table(ctx, table_name)
             datafusion_predicate_applied = False
             if self._predicate_pushdown and self._deferred_predicate is not None:
-                from .pushdown import apply_predicate_pushdown
-
                 _fmt_key = str(input_fmt).rsplit(".", 1)[-1]
                 _scols, _ucols, _fcols = _FORMAT_COLUMN_TYPES.get(
                     _fmt_key, (None, None, None)
@@ -3798,11 +3932,13 @@ class AnnotationLazyFrameWrapper:
                 ]
                 query_df = query_df.select(*select_exprs)
 
+            # Keep pushdown enabled on the projected scan so filters/selects
+            # chained after this one are applied by DataFusion during the scan.
             new_lf = _lazy_scan(
                 query_df,
-                False,
-                False,
-                table.name,
+                self._projection_pushdown,
+                self._predicate_pushdown,
+                table_name,
                 input_fmt,
                 self._file_path,
                 self._read_options,
@@ -3825,9 +3961,10 @@ class AnnotationLazyFrameWrapper:
     def filter(self, *predicates):
         if not predicates:
             return self
-        pred = predicates[0]
-        for p in predicates[1:]:
-            pred = pred & p
+        if len(predicates) == 1:
+            pred = predicates[0]
+        else:
+            pred = functools.reduce(operator.and_, predicates)
         deferred_predicate = (
             pred
             if self._deferred_predicate is None
@@ -3840,16 +3977,50 @@ class AnnotationLazyFrameWrapper:
     def _extract_predicate_column_names(self):
         if self._deferred_predicate is None:
             return []
-        try:
-            return list(self._deferred_predicate.meta.root_names())
-        except Exception:
-            return []
+        if self._predicate_columns is None:
+            try:
+                self._predicate_columns = list(
+                    self._deferred_predicate.meta.root_names()
+                )
+            except Exception:
+                self._predicate_columns = []
+        return self._predicate_columns
+
+    # Thin forwards for the most common terminal LazyFrame calls, so they skip
+    # the __getattr__ fallback below.
+    def collect(self, *args, **kwargs):
+        return self._base_lf.collect(*args, **kwargs)
+
+    def collect_schema(self):
+        return self._base_lf.collect_schema()
+
+    @property
+    def schema(self):
+        return self._base_lf.schema
+
+    @property
+    def columns(self):
+        return self._base_lf.columns
+
+    def head(self, n: int = 5):
+        return self._base_lf.head(n)
+
+    def limit(self, n: int = 5):
+        return self._base_lf.limit(n)
+
+    def with_columns(self, *exprs, **named_exprs):
+        return self._base_lf.with_columns(*exprs, **named_exprs)
+
+    def sink_parquet(self, *args, **kwargs):
+        return self._base_lf.sink_parquet(*args, **kwargs)
 
     def __getattr__(self, name):
         return getattr(self._base_lf, name)
 
 
 class GffLazyFrameWrapper(AnnotationLazyFrameWrapper):
+    __slots__ = ()
+
     def __init__(
         self,
         base_lf,
@@ -3871,6 +4042,8 @@ class GffLazyFrameWrapper(AnnotationLazyFrameWrapper):
 
 
 class GtfLazyFrameWrapper(AnnotationLazyFrameWrapper):
+    __slots__ = ()
+
     def __init__(
         self,
         base_lf,
@@ -3889,3 +4062,10 @@ class GtfLazyFrameWrapper(AnnotationLazyFrameWrapper):
             "gtf",
             deferred_predicate,
         )
+
+
+# Format identifier (see _FORMAT_STRINGS) -> LazyFrame wrapper used by _read_file.
+_ANNOTATION_WRAPPERS = {
+    "gff": GffLazyFrameWrapper,
+    "gtf": GtfLazyFrameWrapper,
+}
@@ -3,7 +3,6 @@ from typing import Iterator, List, Optional, Union
 import polars as pl
 import pyarrow as pa
 from polars.io.plugins import register_io_source
-from tqdm.auto import tqdm
 
 from ._metadata import set_coordinate_system
 from .context import _resolve_zero_based, ctx
@@ -192,6 +191,8 @@ class PileupOperations:
 
             # Stream batches
             df_stream = query_df.execute_stream()
+            from tqdm.auto import tqdm
+
             progress_bar = tqdm(unit="rows")
             remaining = int(n_rows) if n_rows is not None else None
 
@@ -5,9 +5,7 @@ from typing import Callable, Iterator, Union
 import datafusion
 import polars as pl
 import pyarrow as pa
-from datafusion import DataFrame
 from polars.io.plugins import register_io_source
-from tqdm.auto import tqdm
 
 from polars_bio.polars_bio import (
     BioSessionContext,
@@ -155,6 +153,8 @@ def range_lazy_scan(
 
         df_lazy.schema()
         df_stream = df_lazy.execute_stream()
+        from tqdm.auto import tqdm
+
         progress_bar = tqdm(unit="rows")
         for r in df_stream:
             py_df = r.to_pyarrow()
@@ -346,7 +346,7 @@ def _get_schema(
 
     ext = Path(path).suffixes
     if len(ext) == 0:
-        df: DataFrame = py_read_table(ctx, path)
+        df: datafusion.DataFrame = py_read_table(ctx, path)
         arrow_schema = df.schema()
         empty_table = pa.Table.from_arrays(
             [pa.array([], type=field.type) for field in arrow_schema],
@@ -360,7 +360,7 @@ def _get_schema(
         df = pl.read_csv(path)
     elif ".vcf" in ext:
         table = py_register_table(ctx, path, None, InputFormat.Vcf, read_options)
-        df: DataFrame = py_read_table(ctx, table.name)
+        df: datafusion.DataFrame = py_read_table(ctx, table.name)
         arrow_schema = df.schema()
         empty_table = pa.Table.from_arrays(
             [pa.array([], type=field.type) for field in arrow_schema],
@@ -1,3 +1,4 @@
+import os
 from typing import Union
 
 import polars as pl
@@ -28,18 +29,21 @@ from polars_bio.polars_bio import (
 
 from .context import _resolve_zero_based, ctx
 from .io import (
+    _cached_vcf_info_fields,
     _cleanse_fields,
+    _file_stamp,
     _lazy_scan,
     _normalize_bigbed_schema_mode,
     _normalize_read_tag_type_hints,
     _validate_tag_type_hints,
 )
+from .logging import logger
 
 
 class SQL:
     @staticmethod
     def register_vcf(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         info_fields: Union[list[str], None] = None,
         chunk_size: int = 64,
@@ -54,7 +58,7 @@ class SQL:
         Register a VCF file as a Datafusion table.
 
         Parameters:
-            path: The path to the VCF file.
+            path: The path to the VCF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name of the table will be generated automatically based on the path.
             info_fields: List of INFO field names to register. If *None*, all INFO fields will be detected automatically from the VCF header. Use this to limit registration to specific fields for better performance.
             chunk_size: The size in MB of a chunk when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **8-16**.
@@ -67,6 +71,9 @@ class SQL:
         !!! note
             VCF reader uses **1-based** coordinate system for the `start` and `end` columns.
 
+        !!! note
+            When `info_fields` is *None*, the INFO field names read from the header are cached per path. Local files are described again when their modification time or size changes; after overwriting a file in object storage, call `pb.clear_vcf_header_cache()` before registering it again.
+
         !!! Example
               ```python
               import polars_bio as pb
@@ -78,6 +85,7 @@ class SQL:
         !!! tip
             `chunk_size` and `concurrent_fetches` can be adjusted according to the network bandwidth and the size of the VCF file. As a rule of thumb for large scale operations (reading a whole VCF), it is recommended to the default values.
         """
+        path = os.fspath(path)
 
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
@@ -94,24 +102,21 @@ class SQL:
             all_info_fields = info_fields
         else:
             # Get all info fields from VCF header for automatic field detection
+            # (memoized per path, so re-registering a file skips the header read)
             all_info_fields = None
             try:
-                from .io import IOOperations
-
-                vcf_schema_df = IOOperations.describe_vcf(
-                    path,
-                    allow_anonymous=allow_anonymous,
-                    enable_request_payer=enable_request_payer,
-                    compression_type=compression_type,
-                )
-                all_info_fields = (
-                    vcf_schema_df.filter(pl.col("field_type") == "INFO")
-                    .select("name")
-                    .to_series()
-                    .to_list()
+                all_info_fields = list(
+                    _cached_vcf_info_fields(
+                        path,
+                        allow_anonymous,
+                        enable_request_payer,
+                        compression_type,
+                        _file_stamp(path),
+                    )
                 )
-            except Exception:
+            except (OSError, RuntimeError, ValueError) as exc:
                 # Fallback to empty list if unable to get info fields
+                logger.debug("VCF header probe failed for %s: %s", path, exc)
                 all_info_fields = []
 
         vcf_read_options = VcfReadOptions(
@@ -123,7 +128,7 @@ class SQL:
 
     @staticmethod
     def register_vcf_zarr(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         info_fields: Union[list[str], None] = None,
         format_fields: Union[list[str], None] = None,
@@ -135,7 +140,7 @@ class SQL:
         Register a local VCF Zarr store as a Datafusion table.
 
         Parameters:
-            path: The path to the VCF Zarr store directory.
+            path: The path to the VCF Zarr store directory. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The table name. If *None*, the table name is generated from the path.
             info_fields: Optional list of INFO field names to include. If *None*, local INFO arrays are discovered automatically. Use [] to disable INFO fields.
             format_fields: Optional list of FORMAT field names to include. If *None*, local FORMAT arrays are discovered automatically. Use [] to disable FORMAT fields.
@@ -143,6 +148,7 @@ class SQL:
             samples: Optional list of sample names to include.
             genotype_encoding_raw: If True, output GT as raw typed allele calls. If False, output VCF-style GT strings.
         """
+        path = os.fspath(path)
         zero_based = _resolve_zero_based(use_zero_based)
         vcf_zarr_read_options = VcfZarrReadOptions(
             info_fields=info_fields,
@@ -156,7 +162,7 @@ class SQL:
 
     @staticmethod
     def register_gff(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         chunk_size: int = 64,
         concurrent_fetches: int = 8,
@@ -170,7 +176,7 @@ class SQL:
         Register a GFF file as a Datafusion table.
 
         Parameters:
-            path: The path to the GFF file.
+            path: The path to the GFF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name of the table will be generated automatically based on the path.
             chunk_size: The size in MB of a chunk when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **8-16**.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **1-2**.
@@ -210,6 +216,7 @@ class SQL:
         !!! tip
             `chunk_size` and `concurrent_fetches` can be adjusted according to the network bandwidth and the size of the GFF file. As a rule of thumb for large scale operations (reading a whole GFF), it is recommended to the default values.
         """
+        path = os.fspath(path)
 
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
@@ -230,7 +237,7 @@ class SQL:
 
     @staticmethod
     def register_gtf(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         chunk_size: int = 64,
         concurrent_fetches: int = 8,
@@ -247,7 +254,7 @@ class SQL:
         different attribute syntax (``key "value"`` vs GFF's ``key=value``).
 
         Parameters:
-            path: The path to the GTF file.
+            path: The path to the GTF file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name of the table will be generated automatically based on the path.
             chunk_size: The size in MB of a chunk when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **8-16**.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **1-2**.
@@ -267,6 +274,7 @@ class SQL:
             pb.sql("SELECT chrom, type, start FROM my_gtf").limit(5).collect()
             ```
         """
+        path = os.fspath(path)
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
             enable_request_payer=enable_request_payer,
@@ -286,7 +294,7 @@ class SQL:
 
     @staticmethod
     def register_fastq(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         chunk_size: int = 64,
         concurrent_fetches: int = 8,
@@ -300,7 +308,7 @@ class SQL:
         Register a FASTQ file as a Datafusion table.
 
         Parameters:
-            path: The path to the FASTQ file.
+            path: The path to the FASTQ file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name of the table will be generated automatically based on the path.
             chunk_size: The size in MB of a chunk when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **8-16**.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **1-2**.
@@ -338,6 +346,7 @@ class SQL:
         !!! tip
             `chunk_size` and `concurrent_fetches` can be adjusted according to the network bandwidth and the size of the FASTQ file. As a rule of thumb for large scale operations (reading a whole FASTQ), it is recommended to the default values.
         """
+        path = os.fspath(path)
 
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
@@ -357,7 +366,7 @@ class SQL:
 
     @staticmethod
     def register_bed(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         chunk_size: int = 64,
         concurrent_fetches: int = 8,
@@ -371,7 +380,7 @@ class SQL:
         Register a BED file as a Datafusion table.
 
         Parameters:
-            path: The path to the BED file.
+            path: The path to the BED file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name of the table will be generated automatically based on the path.
             chunk_size: The size in MB of a chunk when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **8-16**.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **1-2**.
@@ -422,6 +431,7 @@ class SQL:
         !!! tip
             `chunk_size` and `concurrent_fetches` can be adjusted according to the network bandwidth and the size of the BED file. As a rule of thumb for large scale operations (reading a whole BED), it is recommended to the default values.
         """
+        path = os.fspath(path)
 
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
@@ -441,7 +451,7 @@ class SQL:
 
     @staticmethod
     def register_fasta(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         chunk_size: int = 8,
         concurrent_fetches: int = 1,
@@ -455,7 +465,7 @@ class SQL:
         Register a FASTA file as a Datafusion table.
 
         Parameters:
-            path: The path to the FASTA file.
+            path: The path to the FASTA file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name of the table will be generated automatically based on the path.
             chunk_size: The size in MB of a chunk when reading from an object store. The default is 8 MB. For large scale operations, it is recommended to increase this value to 64.
             concurrent_fetches: [GCS] The number of concurrent fetches when reading from an object store. The default is 1. For large scale operations, it is recommended to increase this value to 8 or even more.
@@ -476,6 +486,7 @@ class SQL:
             pb.sql("select name, description from test_fasta limit 1").collect()
             ```
         """
+        path = os.fspath(path)
 
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
@@ -495,7 +506,7 @@ class SQL:
 
     @staticmethod
     def register_bigwig(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         chunk_size: int = 64,
         concurrent_fetches: int = 8,
@@ -509,6 +520,7 @@ class SQL:
         """
         Register a BigWig file as a DataFusion table.
         """
+        path = os.fspath(path)
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
             enable_request_payer=enable_request_payer,
@@ -528,7 +540,7 @@ class SQL:
 
     @staticmethod
     def register_bigbed(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         chunk_size: int = 64,
         concurrent_fetches: int = 8,
@@ -543,6 +555,7 @@ class SQL:
         """
         Register a BigBed file as a DataFusion table.
         """
+        path = os.fspath(path)
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
             enable_request_payer=enable_request_payer,
@@ -598,7 +611,7 @@ class SQL:
 
     @staticmethod
     def register_bam(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         tag_fields: Union[list[str], None] = None,
         chunk_size: int = 64,
@@ -615,7 +628,7 @@ class SQL:
         Register a BAM file as a Datafusion table.
 
         Parameters:
-            path: The path to the BAM file.
+            path: The path to the BAM file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name of the table will be generated automatically based on the path.
             tag_fields: List of BAM tag names to include as columns (e.g., ["NM", "MD", "AS"]). If None, no optional tags are parsed (default). Common tags include: NM (edit distance), MD (mismatch string), AS (alignment score), XS (secondary alignment score), RG (read group), CB (cell barcode), UB (UMI barcode).
             chunk_size: The size in MB of a chunk when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **8-16**.
@@ -656,6 +669,7 @@ class SQL:
             `chunk_size` and `concurrent_fetches` can be adjusted according to the network bandwidth and the size of the BAM file. As a rule of thumb for large scale operations (reading a whole BAM), it is recommended keep the default values.
             For more interactive inspecting a schema, it is recommended to decrease `chunk_size` to **8-16** and `concurrent_fetches` to **1-2**.
         """
+        path = os.fspath(path)
 
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
@@ -682,7 +696,7 @@ class SQL:
 
     @staticmethod
     def register_sam(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         tag_fields: Union[list[str], None] = None,
         infer_tag_types: bool = True,
@@ -697,7 +711,7 @@ class SQL:
         the format from the file extension.
 
         Parameters:
-            path: The path to the SAM file.
+            path: The path to the SAM file. A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name will be generated automatically from the path.
             tag_fields: List of SAM tag names to include as columns (e.g., ["NM", "MD", "AS"]).
                 If None, no optional tags are parsed (default).
@@ -712,6 +726,7 @@ class SQL:
             pb.sql("SELECT chrom, flags FROM my_sam").limit(5).collect()
             ```
         """
+        path = os.fspath(path)
         if tag_type_hints is not None:
             _validate_tag_type_hints(tag_type_hints)
             tag_type_hints = _normalize_read_tag_type_hints(tag_type_hints)
@@ -726,7 +741,7 @@ class SQL:
 
     @staticmethod
     def register_cram(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         tag_fields: Union[list[str], None] = None,
         chunk_size: int = 64,
@@ -753,7 +768,7 @@ class SQL:
             ```
 
         Parameters:
-            path: The path to the CRAM file (local or cloud storage: S3, GCS, Azure Blob).
+            path: The path to the CRAM file (local or cloud storage: S3, GCS, Azure Blob). A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name of the table will be generated automatically based on the path.
             tag_fields: List of CRAM tag names to include as columns (e.g., ["NM", "MD", "AS"]). If None, no optional tags are parsed (default). Common tags include: NM (edit distance), MD (mismatch string), AS (alignment score), XS (secondary alignment score), RG (read group), CB (cell barcode), UB (UMI barcode).
             chunk_size: The size in MB of a chunk when reading from an object store. Default settings are optimized for large scale operations. For small scale (interactive) operations, it is recommended to decrease this value to **8-16**.
@@ -772,6 +787,7 @@ class SQL:
             `chunk_size` and `concurrent_fetches` can be adjusted according to the network bandwidth and the size of the CRAM file. As a rule of thumb for large scale operations (reading a whole CRAM), it is recommended to keep the default values.
             For more interactive inspecting a schema, it is recommended to decrease `chunk_size` to **8-16** and `concurrent_fetches` to **1-2**.
         """
+        path = os.fspath(path)
 
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
@@ -799,7 +815,7 @@ class SQL:
 
     @staticmethod
     def register_pairs(
-        path: str,
+        path: Union[str, os.PathLike],
         name: Union[str, None] = None,
         chunk_size: int = 64,
         concurrent_fetches: int = 8,
@@ -816,7 +832,7 @@ class SQL:
         readID, chr1, pos1, chr2, pos2, strand1, strand2.
 
         Parameters:
-            path: The path to the Pairs file (.pairs, .pairs.gz, .pairs.bgz).
+            path: The path to the Pairs file (.pairs, .pairs.gz, .pairs.bgz). A `str` or an `os.PathLike` such as `pathlib.Path`.
             name: The name of the table. If *None*, the name will be generated automatically from the path.
             chunk_size: The size in MB of a chunk when reading from an object store.
             concurrent_fetches: The number of concurrent fetches when reading from an object store.
@@ -836,6 +852,7 @@ class SQL:
             pb.sql("SELECT * FROM hic_contacts WHERE chr1 = 'chr1'").collect()
             ```
         """
+        path = os.fspath(path)
 
         object_storage_options = PyObjectStorageOptions(
             allow_anonymous=allow_anonymous,
@@ -1,10 +1,11 @@
 import logging
-from typing import Iterator, Union
+from typing import TYPE_CHECKING, Iterator, Union
 
 import polars as pl
-from datafusion import DataFrame
 from polars.io.plugins import register_io_source
-from tqdm.auto import tqdm
+
+if TYPE_CHECKING:
+    from datafusion import DataFrame
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +99,8 @@ def _lazy_scan(
             return
 
         df_stream = query_df.execute_stream()
+        from tqdm.auto import tqdm
+
         progress_bar = tqdm(unit="rows")
         for r in df_stream:
             py_df = r.to_pyarrow()
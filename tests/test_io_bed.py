@@ -1,3 +1,5 @@
+from pathlib import Path
+
 import bioframe as bf
 import pandas as pd
 from _expected import DATA_DIR
@@ -48,6 +50,12 @@ class TestBED:
             self.df_bgz["name"][0] == "FRA16A" and self.df_none["name"][4] == "FRA16E"
         )
 
+    def test_path_like(self):
+        path = Path(DATA_DIR) / "io/bed/chr16_fragile_site.bed"
+        df = pb.read_bed(path)
+        assert df.equals(self.df_none)
+        assert pb.get_metadata(df)["path"] == str(path)
+
     def test_register_table(self):
         pb.register_bed(f"{DATA_DIR}/io/bed/chr16_fragile_site.bed.bgz", "test_bed")
         count = pb.sql("select count(*) as cnt from test_bed").collect()
@@ -1,6 +1,8 @@
 import shutil
 from pathlib import Path
 
+import polars as pl
+import pytest
 from _expected import DATA_DIR
 
 import polars_bio as pb
@@ -165,3 +167,117 @@ class TestIOGFF:
         )
         assert len(result) == 1
         assert result.columns == ["chrom", "attributes"]
+
+    @staticmethod
+    def _write_gff_with_gene_id(path, gene_id):
+        src = Path(f"{DATA_DIR}/io/gff/gencode.v38.annotation.gff3")
+        path.write_text(src.read_text().replace("ENSG00000223972.5", gene_id))
+
+    @pytest.mark.parametrize(
+        "project",
+        [
+            lambda lf: lf.select(["chrom", "gene_id"]),
+            lambda lf: lf.sort("start").select(["chrom", "gene_id"]),
+        ],
+        ids=["wrapper_select", "io_source"],
+    )
+    def test_attribute_projection_follows_rewritten_file(
+        self, tmp_path, monkeypatch, project
+    ):
+        """Attribute projections register once per version of the file."""
+        import polars_bio.io as pb_io
+
+        gff_path = tmp_path / "rewritten.gff3"
+        self._write_gff_with_gene_id(gff_path, "ENSG_OLD")
+        lf = pb.scan_gff(str(gff_path), attr_fields=["gene_id"])
+
+        registered = []
+        register_table = pb_io.py_register_table
+
+        def recording_register_table(*args):
+            registered.append(args[2])
+            return register_table(*args)
+
+        monkeypatch.setattr(pb_io, "py_register_table", recording_register_table)
+
+        first = project(lf).collect()
+        second = project(lf).collect()
+        assert first.equals(second)
+        assert first["gene_id"].unique().to_list() == ["ENSG_OLD"]
+        assert len(registered) == 1
+
+        # A different length changes the file stamp even on coarse mtime clocks.
+        self._write_gff_with_gene_id(gff_path, "ENSG_REWRITTEN")
+        third = project(lf).collect()
+        assert third["gene_id"].unique().to_list() == ["ENSG_REWRITTEN"]
+        assert len(registered) == 2
+        assert registered[0] != registered[1]
+
+    def test_filter_after_attribute_projection(self):
+        """Filters chained after an attribute projection still apply correctly."""
+        file_path = f"{DATA_DIR}/io/gff/gencode.v38.annotation.gff3.bgz"
+        result = (
+            pb.scan_gff(file_path)
+            .select(["chrom", "type", "gene_id"])
+            .filter(pl.col("type") == "gene")
+            .collect()
+        )
+        assert result.columns == ["chrom", "type", "gene_id"]
+        assert result["type"].to_list() == ["gene"]
+        assert result["gene_id"][0] == "ENSG00000223972.5"
+
+    @pytest.mark.parametrize(
+        "predicate",
+        [
+            pl.col("start") > 1_000_000,
+            pl.col("chrom") == "chr2",
+            pl.col("Parent") == "mrna0001",
+            (pl.col("type") == "exon") & (pl.col("end") < 500_000),
+        ],
+        ids=["numeric", "static_string", "attribute", "conjunction"],
+    )
+    def test_pushdown_after_attribute_projection_matches_polars(self, predicate):
+        """Filters pushed into a projected attribute scan match a Polars-side filter."""
+        file_path = f"{DATA_DIR}/io/gff/multi_chrom.gff3.gz"
+        columns = ["chrom", "start", "end", "type", "ID", "Parent"]
+
+        pushed = pb.scan_gff(file_path).select(columns).filter(predicate).collect()
+        expected = (
+            pb.scan_gff(file_path, projection_pushdown=False, predicate_pushdown=False)
+            .select(columns)
+            .collect()
+            .filter(predicate)
+        )
+
+        assert len(expected) > 0
+        assert pushed.sort("ID").equals(expected.sort("ID"))
+
+    def test_static_column_select_fast_path(self):
+        """Selecting plain static column names stays on the base LazyFrame."""
+        from polars_bio.io import GffLazyFrameWrapper
+
+        file_path = f"{DATA_DIR}/io/gff/gencode.v38.annotation.gff3.bgz"
+        projected = pb.scan_gff(file_path).select(["chrom", "start", "type"])
+        assert isinstance(projected, GffLazyFrameWrapper)
+        result = projected.limit(1).collect()
+        assert result.columns == ["chrom", "start", "type"]
+        assert pb.scan_gff(file_path).select("chrom").limit(1).collect().columns == [
+            "chrom"
+        ]
+
+    def test_filter_with_multiple_predicates(self):
+        """Several predicates passed to one filter() call are AND-ed together."""
+        file_path = f"{DATA_DIR}/io/gff/gencode.v38.annotation.gff3.bgz"
+        result = (
+            pb.scan_gff(file_path)
+            .filter(pl.col("type") != "exon", pl.col("end") > 12000)
+            .select(["type", "start", "end"])
+            .collect()
+        )
+        expected = (
+            pb.read_gff(file_path)
+            .filter((pl.col("type") != "exon") & (pl.col("end") > 12000))
+            .select(["type", "start", "end"])
+        )
+        assert len(result) == 2
+        assert result.equals(expected)
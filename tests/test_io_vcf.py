@@ -1,3 +1,5 @@
+from pathlib import Path
+
 from _expected import DATA_DIR
 
 import polars_bio as pb
@@ -30,6 +32,48 @@ def test_describe_vcf_single_sample_format_names_match_selectable_columns():
     assert ("FORMAT", "DP") not in rows
 
 
+def test_register_vcf_reuses_cached_info_fields():
+    from polars_bio.io import _cached_vcf_info_fields, clear_vcf_header_cache
+
+    path = f"{DATA_DIR}/io/vcf/multisample.vcf"
+    clear_vcf_header_cache()
+    pb.register_vcf(path, "vcf_info_cache_a")
+    pb.register_vcf(path, "vcf_info_cache_b")
+
+    assert _cached_vcf_info_fields.cache_info().misses == 1
+    assert _cached_vcf_info_fields.cache_info().hits == 1
+    assert "AF" in pb.sql("SELECT * FROM vcf_info_cache_b").collect().columns
+
+    clear_vcf_header_cache()
+    assert _cached_vcf_info_fields.cache_info().currsize == 0
+
+
+def _write_vcf_with_info(path, info_ids):
+    header = ["##fileformat=VCFv4.2"]
+    header += [
+        f'##INFO=<ID={info_id},Number=1,Type=Integer,Description="{info_id}">'
+        for info_id in info_ids
+    ]
+    header.append("##contig=<ID=1>")
+    header.append("#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO")
+    info = ";".join(f"{info_id}=1" for info_id in info_ids)
+    path.write_text("\n".join(header + [f"1\t10\t.\tA\tG\t.\tPASS\t{info}"]) + "\n")
+
+
+def test_register_vcf_rereads_rewritten_local_header(tmp_path):
+    path = tmp_path / "rewritten.vcf"
+    _write_vcf_with_info(path, ["AA", "BB"])
+    pb.register_vcf(str(path), "vcf_rewritten_a")
+    columns = pb.sql("SELECT * FROM vcf_rewritten_a").collect().columns
+    assert {"AA", "BB"} <= set(columns)
+
+    _write_vcf_with_info(path, ["CC"])
+    pb.register_vcf(str(path), "vcf_rewritten_b")
+    columns = pb.sql("SELECT * FROM vcf_rewritten_b").collect().columns
+    assert "CC" in columns
+    assert "AA" not in columns
+
+
 class TestIOVCF:
     """Tests for VCF read functionality."""
 
@@ -60,6 +104,17 @@ class TestIOVCF:
         )
         assert self.df_bgz["ref"][0] == "G" and self.df_none["ref"][0] == "G"
 
+    def test_path_like(self):
+        path = Path(DATA_DIR) / "io/vcf/vep.vcf"
+        lf = pb.scan_vcf(path)
+        assert lf.collect().equals(self.df_none)
+        assert pb.get_metadata(lf)["path"] == str(path)
+        assert pb.describe_vcf(path).equals(pb.describe_vcf(str(path)))
+
+        pb.register_vcf(path, "vcf_path_like")
+        count = pb.sql("SELECT count(*) AS cnt FROM vcf_path_like").collect()
+        assert count["cnt"][0] == 2
+
     def test_sql_projection_pushdown(self):
         """Test SQL queries work with projection pushdown without specifying info_fields."""
         file_path = f"{DATA_DIR}/io/vcf/vep.vcf.bgz"
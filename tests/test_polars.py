@@ -1,3 +1,4 @@
+import polars as pl
 from _expected import (
     PL_COUNT_OVERLAPS_DF1,
     PL_COUNT_OVERLAPS_DF2,
@@ -193,3 +194,35 @@ class TestMergePolars:
     def test_merge_schema_rows_lazy(self):
         result = self.result_lazy.sort(by=self.result_lazy.columns)
         assert self.expected.equals(result)
+
+
+def test_from_polars_lazyframe_matches_dataframe():
+    lf = PL_DF1.lazy().filter(pl.col("pos_start") > 0)
+    pb.from_polars("from_polars_df", lf.collect())
+    pb.from_polars("from_polars_lf", lf)
+
+    query = "SELECT arrow_typeof(contig) AS contig_type, * FROM {}"
+    expected = pb.sql(query.format("from_polars_df")).collect()
+    result = pb.sql(query.format("from_polars_lf")).collect()
+    assert expected.sort(expected.columns).equals(result.sort(result.columns))
+
+
+def test_from_polars_lazyframe_categorical_columns():
+    lf = PL_DF1.lazy().with_columns(pl.col("contig").cast(pl.Categorical))
+    pb.from_polars("from_polars_cat_df", lf.collect())
+    pb.from_polars("from_polars_cat_lf", lf)
+
+    query = "SELECT arrow_typeof(contig) AS contig_type, * FROM {}"
+    expected = pb.sql(query.format("from_polars_cat_df")).collect()
+    result = pb.sql(query.format("from_polars_cat_lf")).collect()
+    assert result["contig_type"][0].startswith("Dictionary")
+    assert expected.sort(expected.columns).equals(result.sort(result.columns))
+
+
+def test_from_polars_empty_lazyframe():
+    lf = PL_DF1.lazy().filter(pl.col("pos_start") < 0)
+    pb.from_polars("from_polars_empty_lf", lf)
+
+    result = pb.sql("SELECT * FROM from_polars_empty_lf").collect()
+    assert result.is_empty()
+    assert result.columns == PL_DF1.columns
@@ -21,6 +21,12 @@ class TestPredicatePushdownSQLGeneration:
         sql_where = _build_sql_where_from_predicate_safe(predicate)
         assert sql_where == "\"chrom\" = 'chr22'"
 
+    def test_in_list_string_literals_are_escaped(self):
+        """Apostrophes in IN-list values are doubled, not emitted raw."""
+        predicate = pl.col("type").is_in(["3'UTR", "exon"])
+        sql_where = _build_sql_where_from_predicate_safe(predicate)
+        assert sql_where == "\"type\" IN ('3''UTR', 'exon')"
+
     def test_simple_numeric_comparison(self):
         """Test simple numeric comparison predicates."""
         test_cases = [
@@ -51,6 +57,16 @@ class TestPredicatePushdownSQLGeneration:
             sql_where = _build_sql_where_from_predicate_safe(predicate)
             assert sql_where == expected_sql
 
+    def test_comparisons_keep_source_order(self):
+        """Comparisons are emitted once each, in predicate order."""
+        predicate = (
+            (pl.col("start") >= 1000)
+            & (pl.col("start") <= 5000)
+            & (pl.col("score") < 5.5)
+        )
+        sql_where = _build_sql_where_from_predicate_safe(predicate)
+        assert sql_where == '"start" BETWEEN 1000 AND 5000 AND "score" < 5.5'
+
     def test_complex_and_predicates(self):
         """Test complex AND predicates with multiple conditions."""
         # Two conditions
@@ -508,7 +524,7 @@ class TestPredicatePushdownEdgeCases:
         """Test predicates with special characters in values."""
         predicate = pl.col("type") == "5'UTR"  # GFF often has special characters
         sql_where = _build_sql_where_from_predicate_safe(predicate)
-        assert sql_where == "\"type\" = '5'UTR'"
+        assert sql_where == "\"type\" = '5''UTR'"
 
 
 @pytest.mark.skipif(
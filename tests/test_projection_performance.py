@@ -204,6 +204,14 @@ def test_column_extraction():
     print(f"Single string: {result}")
     assert result == ["chrom"], f"Expected ['chrom'], got {result}"
 
+    # Test with a single Polars expression
+    result = _extract_column_names_from_expr(pl.col("start"))
+    assert result == ["start"], f"Expected ['start'], got {result}"
+
+    # Unsupported inputs yield no names instead of raising
+    result = _extract_column_names_from_expr(42)
+    assert result == [], f"Expected [], got {result}"
+
     # Test with Polars column expressions
     try:
         result = _extract_column_names_from_expr([pl.col("chrom"), pl.col("start")])
@@ -117,6 +117,36 @@ class TestVCFSourceMetadata:
         # Schema-level metadata may or may not be present depending on VCF file
         # Just verify it doesn't cause errors
 
+    def test_read_vcf_metadata_writes_parquet(self, tmp_path):
+        """Test that config_meta of a read_vcf result serializes to Parquet."""
+        from polars_config_meta import read_parquet_with_meta
+
+        vcf_path = f"{DATA_DIR}/io/vcf/vep.vcf"
+        output_path = tmp_path / "read.parquet"
+
+        df = pb.read_vcf(vcf_path)
+        df.config_meta.write_parquet(str(output_path))
+
+        restored = read_parquet_with_meta(str(output_path))
+        assert get_source_metadata(restored)["header"] == (
+            get_source_metadata(df)["header"]
+        )
+
+    def test_scan_vcf_metadata_writes_parquet(self, tmp_path):
+        """Test that config_meta of a scan_vcf result serializes to Parquet."""
+        from polars_config_meta import read_parquet_with_meta
+
+        vcf_path = f"{DATA_DIR}/io/vcf/vep.vcf"
+        output_path = tmp_path / "scan.parquet"
+
+        lf = pb.scan_vcf(vcf_path)
+        lf.config_meta.write_parquet(str(output_path))
+
+        restored = read_parquet_with_meta(str(output_path))
+        meta = get_source_metadata(restored)
+        assert meta["format"] == "vcf"
+        assert "info_fields" in meta["header"]
+
     def test_vcf_roundtrip_preserves_metadata(self, tmp_path):
         """Test that VCF metadata survives write/read round-trip."""
         input_path = f"{DATA_DIR}/io/vcf/vep.vcf"
@@ -230,6 +260,41 @@ class TestOtherFormatsSourceMetadata:
         assert fasta_path in meta["path"]
 
 
+class TestRowLimitedReads:
+    """n_rows on the eager readers keeps the leading rows and the source metadata."""
+
+    @pytest.mark.parametrize(
+        "reader, path, n_rows",
+        [
+            (pb.read_vcf, "io/vcf/vep.vcf", 1),
+            (pb.read_vcf_zarr, "io/vcf_zarr/multi_chrom.vcz", 3),
+            (pb.read_gff, "io/gff/gencode.v38.annotation.gff3", 2),
+            (pb.read_gtf, "io/gtf/test.gtf", 5),
+            (pb.read_bam, "io/bam/test.bam", 10),
+            (pb.read_sam, "io/sam/test.sam", 10),
+            (pb.read_cram, "io/cram/test.cram", 10),
+            (pb.read_fastq, "io/fastq/example.fastq", 5),
+            (pb.read_fasta, "io/fasta/test.fasta", 1),
+            (pb.read_bed, "io/bed/chr16_fragile_site.bed", 2),
+            (pb.read_pairs, "io/pairs/test.pairs", 2),
+            (pb.read_bigwig, "io/bbi/signal.bw", 2),
+            (pb.read_bigbed, "io/bbi/annotations.bb", 2),
+        ],
+        ids=lambda value: getattr(value, "__name__", None),
+    )
+    def test_read_n_rows(self, reader, path, n_rows):
+        """The limited frame matches the head of a full read."""
+        path = str(DATA_DIR / path)
+        full = reader(path)
+        df = reader(path, n_rows=n_rows)
+
+        assert len(full) > n_rows
+        assert df.equals(full.head(n_rows))
+        meta = get_source_metadata(df)
+        assert meta["format"] == get_source_metadata(full)["format"]
+        assert meta["path"] == path
+
+
 class TestVCFConvenienceWrappers:
     """Tests for VCF metadata convenience wrapper functions."""
 